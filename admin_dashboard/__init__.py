@@ -1,7 +1,15 @@
 """
 admin_dashboard package
+
+AdminDashboard is resolved lazily so that the CLI (admin_dashboard.utils) and
+the non-UI helpers can be imported without loading gradio.
 """
 
-from admin_dashboard.dashboard import AdminDashboard
+__all__ = ["AdminDashboard"]
+
 
-__all__ = ["AdminDashboard"]
\ No newline at end of file
+def __getattr__(name):
+    if name == "AdminDashboard":
+        from admin_dashboard.dashboard import AdminDashboard
+        return AdminDashboard
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,25 +1,50 @@
 """
-Analytics: statistics display, timeseries, and recent image attachments.
+Analytics: statistics display, timeseries, live-monitor reads, and recent image attachments.
 """
 
-import json
 import logging
-from typing import List
+from typing import List, Optional
 
 import pandas as pd
 
+from admin_dashboard.cache import TTLCache
+from admin_dashboard.dataframes import build_conv_summary_df, parse_image_paths
+
 logger = logging.getLogger(__name__)
 
+# Upper bound only: writes are caught by the data-version check, the TTL covers
+# time-based figures ("today", "active in 7 days") drifting with the clock
+STATS_TTL_SECONDS = 120
+LIVE_TTL_SECONDS  = 4    # live-monitor reads; shorter than the timer interval
+
 
 class Analytics:
     """Read-only analytics queries on top of the database."""
 
     def __init__(self, db):
         self.db = db
+        self._cache = TTLCache(ttl=STATS_TTL_SECONDS)
+        self._live_cache = TTLCache(ttl=LIVE_TTL_SECONDS, maxsize=32)
+        self._data_version = None
+
+    def invalidate(self):
+        """Forget cached statistics (call after admin-initiated writes)."""
+        # Live-monitor reads show no user status and expire within LIVE_TTL_SECONDS anyway
+        self._cache.clear()
+
+    def _sync_data_version(self):
+        """Drop cached statistics/timeseries once users or conversations changed."""
+        version = self.db.get_data_version()
+        if version is not None and version != self._data_version:
+            if self._data_version is not None:
+                logger.debug(f"Analytics cache invalidated: data version {self._data_version} -> {version}")
+            self._cache.clear()
+            self._data_version = version
 
     def get_statistics_md(self) -> str:
         """Return a formatted Markdown string of system-wide statistics."""
-        stats = self.db.get_statistics()
+        self._sync_data_version()
+        stats = self._cache.get_or_compute("statistics", self.db.get_statistics)
         if not stats:
             return "No statistics available."
         return f"""
@@ -37,7 +62,11 @@ class Analytics:
 
     def get_timeseries_df(self, days: int = 14) -> pd.DataFrame:
         """Conversations-per-day DataFrame for the last `days` days."""
-        series = self.db.get_conversations_timeseries(days=days)
+        self._sync_data_version()
+        series = self._cache.get_or_compute(
+            ("timeseries", days),
+            lambda: self.db.get_conversations_timeseries(days=days),
+        )
         if not series:
             return pd.DataFrame({"date": [], "conversations": []})
         return pd.DataFrame({
@@ -45,22 +74,34 @@ class Analytics:
             "conversations": [count     for _, count in series],
         })
 
+    def get_live_convs_df(self, limit: int, after_id: Optional[int] = None) -> pd.DataFrame:
+        """Newest conversations for the live monitor (only those after `after_id` when given)."""
+        # Concurrent admin sessions ticking within LIVE_TTL_SECONDS share one query
+        return self._live_cache.get_or_compute(
+            ("recent", limit, after_id),
+            lambda: build_conv_summary_df(
+                self.db.get_recent_conversations_summary(limit=limit, after_id=after_id)
+            ),
+        )
+
     def get_recent_image_paths(self, limit: int = 20) -> List[str]:
         """Return file paths for the most recent image attachments."""
-        recent = self.db.get_recent_conversations(limit=200)
+        # Shared by every admin session's timer within LIVE_TTL_SECONDS
+        return self._live_cache.get_or_compute(
+            ("images", limit), lambda: self._recent_image_paths(limit)
+        )
+
+    def _recent_image_paths(self, limit: int) -> List[str]:
+        # Every row has at least one image, so `limit` rows always suffice
         image_paths: List[str] = []
 
-        for conv, _ in recent:
-            if not getattr(conv, 'attachments', None):
-                continue
+        for attachments in self.db.get_recent_image_attachments(limit):
             try:
-                items = json.loads(conv.attachments)
+                paths = parse_image_paths(attachments)
             except Exception as e:
                 logger.warning(f"Failed to parse attachments JSON: {e}")
                 continue
-            for item in items:
-                if item.get('type') == 'image' and item.get('path'):
-                    image_paths.append(item['path'])
-                    if len(image_paths) >= limit:
-                        return image_paths
-        return image_paths
\ No newline at end of file
+            image_paths.extend(paths)
+            if len(image_paths) >= limit:
+                return image_paths[:limit]
+        return image_paths
@@ -0,0 +1,46 @@
+"""
+TTL cache: small in-process memo for slow-changing dashboard queries.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Dict-backed cache whose entries expire `ttl` seconds after being stored.
+    With `maxsize`, the oldest entry is evicted once the cache is full.
+    """
+
+    def __init__(self, ttl: float = 30.0, maxsize: Optional[int] = None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for `key`, calling `compute()` on a miss or expiry."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and now - entry[0] < self.ttl:
+            return entry[1]
+
+        value = compute()
+        with self._lock:
+            self._entries.pop(key, None)
+            if self.maxsize and len(self._entries) >= self.maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (now, value)
+        return value
+
+    def invalidate(self, key: Hashable):
+        """Drop a single entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop every entry so the next read goes to the database."""
+        with self._lock:
+            self._entries.clear()
@@ -4,10 +4,12 @@ Composes auth, analytics, user_manager, exporter, and UI into one object.
 Exposes create_interface() and launch() — same API as the original admin_dashboard.py.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 
 import gradio as gr
+import pandas as pd
 
 from database import DatabaseRepository
 from auth_service import AuthenticationService
@@ -17,15 +19,20 @@ from admin_dashboard.analytics   import Analytics
 from admin_dashboard.user_manager import UserManager
 from admin_dashboard.exporter    import ConversationExporter
 from admin_dashboard.dataframes  import (
-    build_users_df, build_recent_convs_df, build_user_convs_df
+    build_users_df, build_convs_frame_df, build_conv_summary_df
 )
 from admin_dashboard.ui_tabs import (
+    DEFAULT_PAGE_SIZE,
     build_stats_tab, build_users_tab, build_user_details_tab,
     build_live_monitor_tab, build_conversations_tab,
 )
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CONCURRENCY = 4   # concurrent event handlers across all admin sessions
+HEAVY_CONCURRENCY   = 2   # cap for full-table filters and CSV export
+LIVE_ROWS           = 50  # rows kept in the live monitor table
+
 
 class AdminDashboard:
     """
@@ -39,22 +46,47 @@ class AdminDashboard:
         self.analytics   = Analytics(db)
         self.user_mgr    = UserManager(db)
         self.exporter    = ConversationExporter(db)
+        self._demo       = None
 
     # ── convenience wrappers ─────────────────────────────────────────────────
 
-    def _recent_convs_df(self, limit: int = 50):
-        return build_recent_convs_df(self.db.get_recent_conversations(limit=limit))
+    def _users_df(self, page: int = 0, page_size: int = DEFAULT_PAGE_SIZE):
+        return build_users_df(self.db.get_users_frame(limit=page_size, offset=page * page_size))
 
-    def _filtered_convs_df(self, email, date_from, date_to, conv_type):
+    def _recent_convs_df(self, limit: int = 50, after_id=None, before_id=None):
+        return build_conv_summary_df(
+            self.db.get_recent_conversations_summary(
+                limit=limit, after_id=after_id, before_id=before_id,
+            )
+        )
+
+    def _filtered_convs_df(self, email, date_from, date_to, conv_type,
+                           page_size: int = DEFAULT_PAGE_SIZE, before_id=None):
+        # No filters: the preview query ships 101-char snippets instead of full texts
+        if not (email or date_from or date_to or conv_type):
+            return self._recent_convs_df(limit=page_size, before_id=before_id)
         from admin_dashboard.dataframes import parse_date
-        pairs = self.db.get_conversations_filtered(
+        frame = self.db.get_conversations_filtered_frame(
             user_email=email or None,
             date_from=parse_date(date_from),
             date_to=parse_date(date_to, end_of_day=True),
             conversation_type=conv_type or None,
-            limit=500,
+            limit=page_size,
+            before_id=before_id,
         )
-        return build_recent_convs_df(pairs)
+        return build_convs_frame_df(frame)
+
+    @staticmethod
+    def _max_id(df) -> int:
+        """Newest conversation ID in a conversations table (0 when empty)."""
+        return int(df['ID'].max()) if not df.empty else 0
+
+    @staticmethod
+    def _page_result(df, page: int):
+        """(table, page, label) outputs for a pager; stays put when paging past the end."""
+        if df.empty and page > 0:
+            return gr.update(), page - 1, gr.update()
+        return df, page, f"Page {page + 1}"
 
     # ── interface ────────────────────────────────────────────────────────────
 
@@ -79,9 +111,11 @@ class AdminDashboard:
                         stats_display, stats_ts, refresh_stats_btn = build_stats_tab()
 
                     with gr.Tab("👥 Users"):
-                        (users_table, refresh_users_btn,
+                        (users_table, users_pager, refresh_users_btn,
                          user_id_input, user_status_input,
                          update_status_btn, status_msg) = build_users_tab()
+                        (users_page, users_page_size, users_prev_btn,
+                         users_next_btn, users_page_label) = users_pager
 
                     with gr.Tab("🔍 User Details"):
                         (detail_user_id, get_details_btn,
@@ -91,11 +125,18 @@ class AdminDashboard:
                         (live_table, live_last_refresh, gallery,
                          auto_toggle, manual_refresh_btn,
                          live_timer) = build_live_monitor_tab()
+                        # Last table shown and its newest conversation ID, for delta ticks
+                        live_cache  = gr.State(None)
+                        live_max_id = gr.State(0)
 
-                    with gr.Tab("💬 Conversations & Export"):
+                    with gr.Tab("💬 Conversations & Export") as convs_tab:
                         (filter_email, filter_from, filter_to, filter_type,
-                         apply_filters_btn, export_btn,
-                         convs_table, export_status, export_file) = build_conversations_tab()
+                         apply_filters_btn, export_btn, convs_table, convs_pager,
+                         export_status, export_file) = build_conversations_tab()
+                        (convs_page, convs_page_size, convs_prev_btn,
+                         convs_next_btn, convs_page_label) = convs_pager
+                        convs_loaded  = gr.State(False)
+                        convs_cursors = gr.State([])   # last conversation ID of each page shown
 
             # ── Event handlers ───────────────────────────────────────────────
 
@@ -103,6 +144,10 @@ class AdminDashboard:
                 ok, msg = self.admin_auth.login(username, password)
                 if not ok:
                     return {login_status: msg, auth_state: False}
+
+                # Mostly served from the TTL caches; run in turn on this thread's
+                # connection rather than on throwaway pool threads
+                live_df = self.analytics.get_live_convs_df(LIVE_ROWS)
                 return {
                     login_section:         gr.update(visible=False),
                     dashboard_section:     gr.update(visible=True),
@@ -110,9 +155,10 @@ class AdminDashboard:
                     auth_state:            True,
                     stats_display:         self.analytics.get_statistics_md(),
                     stats_ts:              self.analytics.get_timeseries_df(),
-                    users_table:           build_users_df(self.db.get_all_users(limit=1000)),
-                    convs_table:           self._recent_convs_df(limit=100),
-                    live_table:            self._recent_convs_df(limit=50),
+                    users_table:           self._users_df(0, DEFAULT_PAGE_SIZE),
+                    live_table:            live_df,
+                    live_cache:            live_df,
+                    live_max_id:           self._max_id(live_df),
                     live_last_refresh:     f"_Last updated at {datetime.now().strftime('%H:%M:%S')}_",
                     gallery:               self.analytics.get_recent_image_paths(),
                 }
@@ -121,8 +167,8 @@ class AdminDashboard:
                 login_handler,
                 inputs=[username_input, password_input],
                 outputs=[login_section, dashboard_section, login_status, auth_state,
-                         stats_display, stats_ts, users_table, convs_table,
-                         live_table, live_last_refresh, gallery],
+                         stats_display, stats_ts, users_table,
+                         live_table, live_last_refresh, gallery, live_cache, live_max_id],
             )
 
             # Statistics
@@ -132,24 +178,46 @@ class AdminDashboard:
             )
 
             # Users
+            def users_page_handler(page, page_size):
+                page = max(int(page), 0)
+                return self._page_result(self._users_df(page, int(page_size)), page)
+
+            users_pager_outputs = [users_table, users_page, users_page_label]
             refresh_users_btn.click(
-                lambda: build_users_df(self.db.get_all_users(limit=1000)),
-                outputs=users_table,
+                users_page_handler,
+                inputs=[users_page, users_page_size],
+                outputs=users_pager_outputs,
+            )
+            users_prev_btn.click(
+                lambda p, s: users_page_handler(p - 1, s),
+                inputs=[users_page, users_page_size],
+                outputs=users_pager_outputs,
+            )
+            users_next_btn.click(
+                lambda p, s: users_page_handler(p + 1, s),
+                inputs=[users_page, users_page_size],
+                outputs=users_pager_outputs,
             )
+            users_page_size.change(
+                lambda s: users_page_handler(0, s),
+                inputs=users_page_size,
+                outputs=users_pager_outputs,
+            )
+            def update_status_handler(user_id, new_status):
+                msg = self.user_mgr.update_status(int(user_id) if user_id else 0, new_status)
+                self.analytics.invalidate()
+                return msg
+
             update_status_btn.click(
-                lambda uid, s: self.user_mgr.update_status(int(uid) if uid else 0, s),
+                update_status_handler,
                 inputs=[user_id_input, user_status_input],
                 outputs=status_msg,
             )
 
             # User details
             def user_details_handler(user_id):
-                uid   = int(user_id) if user_id else 0
-                md    = self.user_mgr.get_user_details_md(uid)
-                convs = build_user_convs_df(self.db.get_user_conversations(uid, limit=100))
-                if 'User' in convs.columns:
-                    convs = convs.drop(columns=['User'])
-                return md, convs
+                uid = int(user_id) if user_id else 0
+                return self.user_mgr.get_user_details_md(uid), self.user_mgr.get_user_conversations_df(uid)
 
             get_details_btn.click(
                 user_details_handler,
@@ -158,41 +226,120 @@ class AdminDashboard:
             )
 
             # Live monitor
+            live_outputs = [live_table, live_last_refresh, gallery, live_cache, live_max_id]
+
             def refresh_live():
-                df = self._recent_convs_df(limit=50)
+                df = self.analytics.get_live_convs_df(LIVE_ROWS)
                 ts = datetime.now().strftime('%H:%M:%S')
-                return df, f"_Last updated at {ts}_", self.analytics.get_recent_image_paths()
-
-            manual_refresh_btn.click(refresh_live, outputs=[live_table, live_last_refresh, gallery])
-            live_timer.tick(refresh_live,           outputs=[live_table, live_last_refresh, gallery])
+                return (df, f"_Last updated at {ts}_", self.analytics.get_recent_image_paths(),
+                        df, self._max_id(df))
+
+            # Timer ticks only fetch conversations newer than the last one shown;
+            # idle ticks leave the table and gallery untouched.
+            def tick_live(cached, max_id):
+                if cached is None:
+                    return refresh_live()
+                new = self.analytics.get_live_convs_df(LIVE_ROWS, after_id=max_id)
+                ts  = f"_Last updated at {datetime.now().strftime('%H:%M:%S')}_"
+                if new.empty:
+                    return gr.update(), ts, gr.update(), cached, max_id
+                df = pd.concat([new, cached], ignore_index=True).head(LIVE_ROWS)
+                return df, ts, self.analytics.get_recent_image_paths(), df, self._max_id(new)
+
+            manual_refresh_btn.click(refresh_live, outputs=live_outputs)
+            live_timer.tick(tick_live, inputs=[live_cache, live_max_id], outputs=live_outputs)
             auto_toggle.change(
                 lambda active: gr.update(active=active),
                 inputs=auto_toggle, outputs=live_timer,
             )
 
             # Conversations & export
+            # Keyset pager: page p is fetched after cursors[p - 1], so deep pages
+            # never pay for an OFFSET scan over the rows before them.
+            def convs_page_result(df, page, cursors):
+                table, page, label = self._page_result(df, page)
+                if table is df:
+                    cursors = cursors[:page] + ([int(df['ID'].iloc[-1])] if not df.empty else [])
+                return table, page, label, cursors
+
+            def convs_page_handler(email, date_from, date_to, conv_type, page, page_size, cursors):
+                page = max(int(page), 0)
+                if page > len(cursors):
+                    return gr.update(), page - 1, gr.update(), cursors
+                before = cursors[page - 1] if page > 0 else None
+                df = self._filtered_convs_df(email, date_from, date_to, conv_type,
+                                             int(page_size), before)
+                return convs_page_result(df, page, cursors)
+
+            filter_inputs       = [filter_email, filter_from, filter_to, filter_type]
+            convs_pager_outputs = [convs_table, convs_page, convs_page_label, convs_cursors]
+
+            # Loaded on first visit to the tab rather than on every login
+            def convs_tab_handler(loaded, page_size):
+                if loaded:
+                    return gr.update(), gr.update(), gr.update(), gr.update(), True
+                return (*convs_page_result(self._recent_convs_df(int(page_size)), 0, []), True)
+
+            convs_tab.select(
+                convs_tab_handler,
+                inputs=[convs_loaded, convs_page_size],
+                outputs=convs_pager_outputs + [convs_loaded],
+            )
+
             apply_filters_btn.click(
-                lambda e, df, dt, t: self._filtered_convs_df(e, df, dt, t),
-                inputs=[filter_email, filter_from, filter_to, filter_type],
-                outputs=convs_table,
+                lambda e, df, dt, t, s: convs_page_handler(e, df, dt, t, 0, s, []),
+                inputs=filter_inputs + [convs_page_size],
+                outputs=convs_pager_outputs,
+                concurrency_limit=HEAVY_CONCURRENCY,
+            )
+            convs_prev_btn.click(
+                lambda e, df, dt, t, p, s, c: convs_page_handler(e, df, dt, t, p - 1, s, c),
+                inputs=filter_inputs + [convs_page, convs_page_size, convs_cursors],
+                outputs=convs_pager_outputs,
+            )
+            convs_next_btn.click(
+                lambda e, df, dt, t, p, s, c: convs_page_handler(e, df, dt, t, p + 1, s, c),
+                inputs=filter_inputs + [convs_page, convs_page_size, convs_cursors],
+                outputs=convs_pager_outputs,
+            )
+            convs_page_size.change(
+                lambda e, df, dt, t, s: convs_page_handler(e, df, dt, t, 0, s, []),
+                inputs=filter_inputs + [convs_page_size],
+                outputs=convs_pager_outputs,
             )
 
-            def export_handler(email, date_from, date_to, conv_type):
-                path = self.exporter.export_to_csv(email, date_from, date_to, conv_type)
+            # The CSV write runs in a worker thread; the event loop keeps serving ticks
+            async def export_handler(email, date_from, date_to, conv_type):
+                try:
+                    path = await asyncio.to_thread(
+                        self.exporter.export_to_csv, email, date_from, date_to, conv_type
+                    )
+                except Exception as e:
+                    logger.error(f"Export failed: {e}")
+                    return gr.update(value=None), f"❌ Export failed: {e}"
                 if not path:
                     return gr.update(value=None), "❌ No conversations match these filters."
                 return gr.update(value=path), f"✅ Exported to `{path}`"
 
             export_btn.click(
                 export_handler,
-                inputs=[filter_email, filter_from, filter_to, filter_type],
+                inputs=filter_inputs,
                 outputs=[export_file, export_status],
+                concurrency_limit=HEAVY_CONCURRENCY,
             )
 
         return demo
 
+    def get_interface(self) -> gr.Blocks:
+        """Build the Blocks graph once and reuse it on later calls."""
+        if self._demo is None:
+            self._demo = self.create_interface()
+        return self._demo
+
     def launch(self, share: bool = False):
-        demo = self.create_interface()
+        demo = self.get_interface()
+        # DB reads are I/O-bound: let several handlers run side by side
+        demo.queue(default_concurrency_limit=DEFAULT_CONCURRENCY)
         demo.launch(
             share=share,
             theme=gr.themes.Base(),
@@ -2,106 +2,147 @@
 DataFrame builders: convert DB models into pandas DataFrames for Gradio tables.
 """
 
-import json
 import logging
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime, time
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 import pandas as pd
 
+try:
+    from orjson import loads as json_loads   # C parser, much faster on small attachment blobs
+except ImportError:
+    from json import loads as json_loads
+
+from models import UserStatus
+
 logger = logging.getLogger(__name__)
 
 # ── Column definitions ────────────────────────────────────────────────────────
-USER_COLS         = ['ID', 'Email', 'Name', 'Status', 'Total Queries', 'Created', 'Last Login']
-CONV_COLS         = ['ID', 'User', 'Message', 'Response', 'Type', 'Time', 'Response Time (ms)']
-CONV_COLS_NO_USER = ['ID', 'User ID', 'Message', 'Response', 'Type', 'Time', 'Response Time (ms)']
-CONV_COLS_EXPORT  = CONV_COLS + ['Image Paths']
+# Tuples: shared by the table builders and the gr.Dataframe headers, never mutated
+USER_COLS         = ('ID', 'Email', 'Name', 'Status', 'Total Queries', 'Created', 'Last Login')
+CONV_COLS         = ('ID', 'User', 'Message', 'Response', 'Type', 'Time', 'Response Time (ms)')
+CONV_COLS_NO_USER = ('ID', 'User ID', 'Message', 'Response', 'Type', 'Time', 'Response Time (ms)')
+CONV_COLS_EXPORT  = CONV_COLS + ('Image Paths',)
+
+# Arrow string kernels for len/slice when pyarrow is installed
+try:
+    import pyarrow  # noqa: F401
+    _TEXT_DTYPE = 'string[pyarrow]'
+except ImportError:
+    _TEXT_DTYPE = object
+
+# Fixed category set so Status codes stay stable across pages
+STATUS_DTYPE = pd.CategoricalDtype([s.value for s in UserStatus])
+
+
+def _format_times(values, fmt: str, missing: Optional[str] = None):
+    """Format a list of datetimes in one vectorised call; None becomes `missing`."""
+    formatted = pd.Series(pd.to_datetime(values)).dt.strftime(fmt)
+    if missing is not None:
+        formatted = formatted.fillna(missing)
+    return formatted.to_numpy()
+
+
+def _truncate(values: List[str], width: int = 100):
+    """Cut strings longer than `width` and append '...', without a per-row branch."""
+    texts = pd.Series(values, dtype=_TEXT_DTYPE)
+    too_long = texts.str.len() > width
+    return texts.where(~too_long, texts.str.slice(0, width) + '...').to_numpy()
 
 
-def build_users_df(users) -> pd.DataFrame:
-    if not users:
+def build_users_df(users_frame: pd.DataFrame) -> pd.DataFrame:
+    """Display table from DatabaseRepository.get_users_frame (raw users columns)."""
+    if users_frame.empty:
         return pd.DataFrame(columns=USER_COLS)
-    rows = [
-        {
-            'ID': u.user_id,
-            'Email': u.email,
-            'Name': u.full_name,
-            'Status': u.status.value,
-            'Total Queries': u.total_queries,
-            'Created': u.created_at.strftime('%Y-%m-%d %H:%M'),
-            'Last Login': u.last_login.strftime('%Y-%m-%d %H:%M') if u.last_login else 'Never',
-        }
-        for u in users
-    ]
-    return pd.DataFrame(rows)
-
-
-def _conv_row(conv, user_label, truncate: bool = True) -> dict:
-    """Build a single conversation row dict."""
-
-    def _t(text):
-        return (text[:100] + '...') if truncate and len(text) > 100 else text
-
-    return {
-        'ID': conv.conversation_id,
-        'User': user_label,
-        'Message': _t(conv.message),
-        'Response': _t(conv.response),
-        'Type': conv.conversation_type,
-        'Time': conv.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-        'Response Time (ms)': conv.response_time_ms or 'N/A',
-    }
-
-
-def build_recent_convs_df(recent_pairs, truncate: bool = True) -> pd.DataFrame:
-    """recent_pairs is List[Tuple[Conversation, User]]."""
-    rows = [_conv_row(conv, user.email, truncate) for conv, user in recent_pairs]
-    return pd.DataFrame(rows) if rows else pd.DataFrame(columns=CONV_COLS)
+    created    = pd.to_datetime(users_frame['created_at'], format='ISO8601')
+    last_login = pd.to_datetime(users_frame['last_login'], format='ISO8601')
+    return pd.DataFrame({
+        'ID':            users_frame['user_id'],
+        'Email':         users_frame['email'],
+        'Name':          users_frame['full_name'],
+        'Status':        users_frame['status'].astype(STATUS_DTYPE),
+        'Total Queries': users_frame['total_queries'],
+        'Created':       created.dt.strftime('%Y-%m-%d %H:%M'),
+        'Last Login':    last_login.dt.strftime('%Y-%m-%d %H:%M').fillna('Never'),
+    })
+
+
+def _build_convs_df(conversations, user_col: str, user_values: list, truncate: bool = True) -> pd.DataFrame:
+    """Column-wise conversation table shared by the recent and per-user builders."""
+    messages  = [c.message for c in conversations]
+    responses = [c.response for c in conversations]
+    return pd.DataFrame({
+        'ID':                 [c.conversation_id for c in conversations],
+        user_col:             user_values,
+        'Message':            _truncate(messages) if truncate else messages,
+        'Response':           _truncate(responses) if truncate else responses,
+        'Type':               pd.Categorical([c.conversation_type for c in conversations]),
+        'Time':               _format_times([c.timestamp for c in conversations], '%Y-%m-%d %H:%M:%S'),
+        'Response Time (ms)': [c.response_time_ms or 'N/A' for c in conversations],
+    })
+
+
+def build_convs_frame_df(frame: pd.DataFrame) -> pd.DataFrame:
+    """Display table from DatabaseRepository.get_conversations_filtered_frame."""
+    if frame.empty:
+        return pd.DataFrame(columns=CONV_COLS)
+    response_ms = frame['response_time_ms'].fillna(0).astype('int64')
+    return pd.DataFrame({
+        'ID':                 frame['conversation_id'],
+        'User':               frame['email'],
+        'Message':            _truncate(frame['message_preview']),
+        'Response':           _truncate(frame['response_preview']),
+        'Type':               frame['conversation_type'].astype('category'),
+        'Time':               frame['time'],
+        'Response Time (ms)': response_ms.astype(object).where(response_ms != 0, 'N/A'),
+    })
 
 
 def build_user_convs_df(conversations) -> pd.DataFrame:
     """Single-user conversation list (no email column)."""
     if not conversations:
         return pd.DataFrame(columns=CONV_COLS_NO_USER)
-    rows = [
-        {
-            'ID': c.conversation_id,
-            'User ID': c.user_id,
-            'Message': (c.message[:100] + '...') if len(c.message) > 100 else c.message,
-            'Response': (c.response[:100] + '...') if len(c.response) > 100 else c.response,
-            'Type': c.conversation_type,
-            'Time': c.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-            'Response Time (ms)': c.response_time_ms or 'N/A',
-        }
-        for c in conversations
-    ]
-    return pd.DataFrame(rows)
-
-
-def build_export_rows(conv_pairs) -> List[dict]:
-    """Full-content rows including image attachment paths (for CSV export)."""
-    rows = []
-    for conv, user in conv_pairs:
-        image_paths = []
-        if getattr(conv, 'attachments', None):
-            try:
-                for item in json.loads(conv.attachments):
-                    if item.get('type') == 'image' and item.get('path'):
-                        image_paths.append(item['path'])
-            except Exception as e:
-                logger.warning(f"Failed to parse attachments for conv {conv.conversation_id}: {e}")
-
-        rows.append({
-            'ID': conv.conversation_id,
-            'User': user.email,
-            'Message': conv.message,
-            'Response': conv.response,
-            'Type': conv.conversation_type,
-            'Time': conv.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-            'Response Time (ms)': conv.response_time_ms or 'N/A',
-            'Image Paths': ';'.join(image_paths),
-        })
-    return rows
+    return _build_convs_df(conversations, 'User ID', [c.user_id for c in conversations])
+
+
+def build_conv_summary_df(summary_rows) -> pd.DataFrame:
+    """Rows from DatabaseRepository.get_recent_conversations_summary (SQL-side previews)."""
+    if not summary_rows:
+        return pd.DataFrame(columns=CONV_COLS)
+    return pd.DataFrame({
+        'ID':                 [r['conversation_id'] for r in summary_rows],
+        'User':               [r['email'] for r in summary_rows],
+        'Message':            _truncate([r['message_preview'] for r in summary_rows]),
+        'Response':           _truncate([r['response_preview'] for r in summary_rows]),
+        'Type':               pd.Categorical([r['conversation_type'] for r in summary_rows]),
+        'Time':               [r['time'] for r in summary_rows],
+        'Response Time (ms)': [r['response_time_ms'] or 'N/A' for r in summary_rows],
+    })
+
+
+@lru_cache(maxsize=1024)
+def parse_image_paths(attachments: str) -> Tuple[str, ...]:
+    """
+    Image paths listed in an attachments JSON blob. Memoised: stored attachments
+    never change, so gallery ticks and exports parse each blob once.
+    Raises ValueError on malformed JSON.
+    """
+    return tuple(
+        item['path'] for item in json_loads(attachments)
+        if item.get('type') == 'image' and item.get('path')
+    )
+
+
+@lru_cache(maxsize=256)
+def _parse_ymd(date_str: str) -> datetime:
+    # Filter dates repeat across Apply/Next/Export clicks; datetimes are immutable.
+    # date.fromisoformat is the C fast path, used only for the exact YYYY-MM-DD shape:
+    # it also takes 20240203 and ISO week dates, which '%Y-%m-%d' rejects. Anything
+    # else (unpadded 2024-2-3, or invalid input) goes through strptime as before.
+    if len(date_str) == 10 and date_str[4] == date_str[7] == '-':
+        return datetime.combine(date.fromisoformat(date_str), time.min)
+    return datetime.strptime(date_str, '%Y-%m-%d')
 
 
 def parse_date(date_str: str, end_of_day: bool = False) -> Optional[datetime]:
@@ -109,7 +150,7 @@ def parse_date(date_str: str, end_of_day: bool = False) -> Optional[datetime]:
     if not date_str:
         return None
     try:
-        dt = datetime.strptime(date_str, '%Y-%m-%d')
+        dt = _parse_ymd(date_str)
         return dt.replace(hour=23, minute=59, second=59) if end_of_day else dt
     except ValueError:
         logger.warning(f"Invalid date format: {date_str}")
@@ -2,18 +2,23 @@
 Exporter: filtered conversation CSV export with image attachment copying.
 """
 
+import csv
+import itertools
 import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-import pandas as pd
-
-from admin_dashboard.dataframes import build_export_rows, parse_date
+from admin_dashboard.dataframes import CONV_COLS_EXPORT, parse_date
 
 logger = logging.getLogger(__name__)
 
+IMAGE_COPY_WORKERS = 8
+CSV_BUFFER_BYTES   = 1 << 20   # export file write buffer
+
 
 class ConversationExporter:
     """Exports filtered conversations to CSV and copies image attachments."""
@@ -29,56 +34,107 @@ class ConversationExporter:
         conversation_type: str,
     ) -> Optional[str]:
         """
-        Export filtered conversations to a CSV file.
+        Export filtered conversations to a CSV file, streamed straight from the
+        database cursor (no row cap, constant memory).
         Returns the path to the CSV file, or None if no data matched.
+        Database errors propagate; a partially written file is removed first.
         """
-        conversations = self.db.get_conversations_filtered(
+        rows = self.db.iter_conversations_filtered(
             user_email=user_email or None,
             date_from=parse_date(date_from),
             date_to=parse_date(date_to, end_of_day=True),
             conversation_type=conversation_type or None,
-            limit=500,
         )
-
-        rows = build_export_rows(conversations)
-        if not rows:
+        first = next(rows, None)
+        if first is None:
             return None
 
-        # Copy images into exports/images/ and rewrite paths in rows
+        # Copy images into exports/images/ and rewrite paths as rows stream past
         exports_dir = Path("exports")
         images_dir  = exports_dir / "images"
         images_dir.mkdir(parents=True, exist_ok=True)
 
+        # One timestamp per export; images are told apart by a per-export index
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
         path_map: dict = {}
-        for row in rows:
-            if not row['Image Paths']:
-                continue
+        dir_listings: dict = {}   # parent dir -> file names, one os.scandir per directory
+        # Image copies overlap with the CSV write; leaving the pool waits for them all
+        pool = ThreadPoolExecutor(max_workers=IMAGE_COPY_WORKERS)
+
+        def rewrite(paths: str) -> str:
+            if not paths:
+                return paths
             new_paths = []
-            for path in row['Image Paths'].split(';'):
+            for path in paths.split(';'):
                 if path not in path_map:
-                    path_map[path] = self._copy_image(path, images_dir, exports_dir)
+                    path_map[path] = self._copy_image(
+                        pool, path, images_dir, exports_dir, timestamp, len(path_map), dir_listings
+                    )
                 new_paths.append(path_map[path])
-            row['Image Paths'] = ';'.join(new_paths)
+            return ';'.join(new_paths)
 
-        df = pd.DataFrame(rows)
         safe_email = (user_email or "all").replace("@", "_").replace(".", "_")
-        timestamp  = datetime.now().strftime("%Y%m%d_%H%M%S")
         out_path   = exports_dir / f"conversations_{safe_email}_{timestamp}.csv"
-        df.to_csv(out_path, index=False, encoding="utf-8")
-        logger.info(f"Exported {len(df)} conversations to {out_path}")
+
+        # writerows drives the generator from C; zip advances `rows_written` once per row
+        rows_written = itertools.count()
+        try:
+            with pool, open(out_path, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_BYTES) as f:
+                writer = csv.writer(f)
+                writer.writerow(CONV_COLS_EXPORT)
+                writer.writerows(
+                    (
+                        row.conversation_id,
+                        row.email,
+                        row.message,
+                        row.response,
+                        row.conversation_type,
+                        row.timestamp.isoformat(' ', 'seconds'),
+                        row.response_time_ms or 'N/A',
+                        rewrite(row.image_paths),
+                    )
+                    for row, _ in zip(itertools.chain((first,), rows), rows_written)
+                )
+        except Exception:
+            # Never leave a truncated CSV behind looking like a finished export
+            out_path.unlink(missing_ok=True)
+            raise
+
+        logger.info(f"Exported {next(rows_written)} conversations to {out_path}")
         return str(out_path)
 
-    def _copy_image(self, src_str: str, images_dir: Path, exports_dir: Path) -> str:
-        """Copy a single image to images_dir and return its relative path."""
+    def _copy_image(self, pool: ThreadPoolExecutor, src_str: str, images_dir: Path,
+                    exports_dir: Path, export_ts: str, idx: int, dir_listings: dict) -> str:
+        """Schedule a copy of one image into images_dir and return its relative path."""
         src = Path(src_str)
-        if not src.exists():
+        if not self._exists(src, dir_listings):
             logger.warning(f"Image not found: {src_str}")
             return src_str
+        dest = images_dir / f"{src.stem}_{export_ts}_{idx}{src.suffix}"
+        pool.submit(self._link_or_copy, src, dest)
+        return str(dest.relative_to(exports_dir))
+
+    @staticmethod
+    def _exists(src: Path, dir_listings: dict) -> bool:
+        """Existence check against a cached listing of src's directory (no stat per image)."""
+        names = dir_listings.get(src.parent)
+        if names is None:
+            try:
+                with os.scandir(src.parent) as entries:
+                    names = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                names = set()
+            dir_listings[src.parent] = names
+        return src.name in names
+
+    @staticmethod
+    def _link_or_copy(src: Path, dest: Path):
+        """Hard-link on the same filesystem (no bytes copied), else copy contents only."""
         try:
-            ts   = datetime.now().strftime("%Y%m%d_%H%M%S")
-            dest = images_dir / f"{src.stem}_{ts}{src.suffix}"
-            shutil.copy2(src, dest)
-            return str(dest.relative_to(exports_dir))
-        except Exception as e:
-            logger.error(f"Failed to copy image {src_str}: {e}")
-            return src_str
\ No newline at end of file
+            os.link(src, dest)
+        except OSError:
+            try:
+                shutil.copyfile(src, dest)
+            except Exception as e:
+                logger.error(f"Failed to copy image {src}: {e}")
@@ -5,9 +5,6 @@ Run with:  python -m admin_dashboard.launcher
 """
 
 import logging
-from database import DatabaseRepository
-from auth_service import AuthenticationService
-from admin_dashboard.dashboard import AdminDashboard
 
 logging.basicConfig(
     level=logging.INFO,
@@ -25,6 +22,11 @@ def main():
     print("=" * 60)
 
     try:
+        # Imported here so the banner appears before gradio/pandas finish loading
+        from database import DatabaseRepository
+        from auth_service import AuthenticationService
+        from admin_dashboard.dashboard import AdminDashboard
+
         db   = DatabaseRepository("data/chatbot.db")
         auth = AuthenticationService(db)
         admin = AdminDashboard(db, auth)
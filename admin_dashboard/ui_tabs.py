@@ -6,6 +6,25 @@ Called by ui_builder.py to compose the full dashboard layout.
 import pandas as pd
 import gradio as gr
 
+from admin_dashboard.dataframes import USER_COLS, CONV_COLS, CONV_COLS_NO_USER
+
+DEFAULT_PAGE_SIZE = 50
+PAGE_SIZE_CHOICES = [25, 50, 100]
+TABLE_MAX_HEIGHT  = 500   # px; keeps paginated tables scrolling inside a fixed viewport
+
+
+def build_pager():
+    """Prev/Next pagination controls shared by the paginated tables."""
+    page_state = gr.State(0)
+    with gr.Row():
+        prev_btn   = gr.Button("◀ Prev", size="sm")
+        page_label = gr.Markdown("Page 1")
+        next_btn   = gr.Button("Next ▶", size="sm")
+        page_size  = gr.Dropdown(
+            choices=PAGE_SIZE_CHOICES, value=DEFAULT_PAGE_SIZE, label="Rows per page"
+        )
+    return page_state, page_size, prev_btn, next_btn, page_label
+
 
 def build_stats_tab():
     """📊 Statistics tab components."""
@@ -22,9 +41,11 @@ def build_stats_tab():
 def build_users_tab():
     """👥 Users tab components."""
     users_table = gr.Dataframe(
-        headers=['ID', 'Email', 'Name', 'Status', 'Total Queries', 'Created', 'Last Login'],
-        wrap=True,
+        headers=list(USER_COLS),
+        wrap=False,
+        max_height=TABLE_MAX_HEIGHT,
     )
+    pager       = build_pager()
     refresh_btn = gr.Button("🔄 Refresh Users")
 
     gr.Markdown("### User Management")
@@ -35,7 +56,7 @@ def build_users_tab():
         )
     update_btn    = gr.Button("Update Status")
     status_msg    = gr.Markdown("")
-    return users_table, refresh_btn, user_id_input, user_status_input, update_btn, status_msg
+    return users_table, pager, refresh_btn, user_id_input, user_status_input, update_btn, status_msg
 
 
 def build_user_details_tab():
@@ -45,7 +66,7 @@ def build_user_details_tab():
     details_md     = gr.Markdown("")
     gr.Markdown("### User's Conversation History")
     convs_table = gr.Dataframe(
-        headers=['ID', 'User ID', 'Message', 'Response', 'Type', 'Time', 'Response Time (ms)'],
+        headers=list(CONV_COLS_NO_USER),
         wrap=True,
     )
     return detail_user_id, get_btn, details_md, convs_table
@@ -58,7 +79,7 @@ def build_live_monitor_tab():
         "Enable auto-refresh to monitor activity while the chatbot is running."
     )
     live_table   = gr.Dataframe(
-        headers=['ID', 'User', 'Message', 'Response', 'Type', 'Time', 'Response Time (ms)'],
+        headers=list(CONV_COLS),
         wrap=True,
     )
     last_refresh = gr.Markdown("")
@@ -82,9 +103,12 @@ def build_conversations_tab():
         apply_btn  = gr.Button("Apply filters")
         export_btn = gr.Button("Export to CSV")
     convs_table   = gr.Dataframe(
-        headers=['ID', 'User', 'Message', 'Response', 'Type', 'Time', 'Response Time (ms)'],
-        wrap=True,
+        headers=list(CONV_COLS),
+        wrap=False,
+        max_height=TABLE_MAX_HEIGHT,
     )
+    pager         = build_pager()
     export_status = gr.Markdown("")
     export_file   = gr.File(label="Download CSV", interactive=False)
-    return filter_email, filter_from, filter_to, filter_type, apply_btn, export_btn, convs_table, export_status, export_file
\ No newline at end of file
+    return (filter_email, filter_from, filter_to, filter_type, apply_btn, export_btn,
+            convs_table, pager, export_status, export_file)
\ No newline at end of file
@@ -3,27 +3,52 @@ User management: fetch user details and update user status.
 """
 
 import logging
-from models import UserStatus
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+from models import Conversation, User, UserStatus
+from admin_dashboard.cache import TTLCache
+from admin_dashboard.dataframes import build_user_convs_df
 
 logger = logging.getLogger(__name__)
 
+CONVERSATION_WINDOW = 100   # rows shown in the user's history table
+RECENT_SHOWN        = 10    # rows counted as "recent" in the details card
+
+_STATUS_MAP = {s.value: s for s in UserStatus}
+
 
 class UserManager:
     """Handles user detail queries and status mutations."""
 
     def __init__(self, db):
         self.db = db
+        # user_id -> (user, last CONVERSATION_WINDOW conversations), shared by
+        # the details card and the history table and reused across clicks
+        self._details_cache = TTLCache(ttl=15, maxsize=256)
+
+    def _user_with_conversations(self, user_id: int) -> Tuple[Optional[User], List[Conversation]]:
+        return self._details_cache.get_or_compute(
+            user_id,
+            lambda: self.db.get_user_with_conversations(user_id, limit=CONVERSATION_WINDOW),
+        )
+
+    def get_user_conversations_df(self, user_id: int) -> pd.DataFrame:
+        """The user's recent conversation history as a table."""
+        _, conversations = self._user_with_conversations(user_id) if user_id else (None, [])
+        return build_user_convs_df(conversations)
 
     def get_user_details_md(self, user_id: int) -> str:
         """Return Markdown-formatted user details."""
         if not user_id:
             return "Please enter a user ID."
 
-        user = self.db.get_user_by_id(user_id)
+        user, conversations = self._user_with_conversations(user_id)
         if not user:
             return f"❌ User with ID {user_id} not found."
 
-        conversations = self.db.get_user_conversations(user_id, limit=10)
+        recent = conversations[:RECENT_SHOWN]
         return f"""
 ## 👤 User Details
 
@@ -38,7 +63,7 @@ class UserManager:
 - Created: {user.created_at.strftime('%Y-%m-%d %H:%M:%S')}
 - Last Login: {user.last_login.strftime('%Y-%m-%d %H:%M:%S') if user.last_login else 'Never'}
 
-**Recent Conversations:** {len(conversations)}
+**Recent Conversations:** {len(recent)}
 """
 
     def update_status(self, user_id: int, new_status: str) -> str:
@@ -46,13 +71,14 @@ class UserManager:
         if not user_id:
             return "Please enter a user ID."
 
+        status = _STATUS_MAP.get((new_status or '').lower())
+        if status is None:
+            return f"❌ Invalid status: {new_status}. Valid values: {', '.join(_STATUS_MAP)}."
+
         user = self.db.get_user_by_id(user_id)
         if not user:
             return f"❌ User with ID {user_id} not found."
 
-        try:
-            status = UserStatus(new_status.lower())
-            self.db.update_user_status(user_id, status)
-            return f"✅ User {user_id} status updated to **{status.value}**."
-        except ValueError:
-            return f"❌ Invalid status: {new_status}. Valid values: active, inactive, blocked."
\ No newline at end of file
+        self.db.update_user_status(user_id, status)
+        self._details_cache.invalidate(user_id)
+        return f"✅ User {user_id} status updated to **{status.value}**."
\ No newline at end of file
@@ -5,7 +5,7 @@ Run with:  python -m admin_dashboard.utils <command>
 
 Available commands:
   create-admin <username> <password>
-  list-users
+  list-users [--page N] [--page-size N]
   block-user <user_id>
   unblock-user <user_id>
   stats
@@ -16,16 +16,24 @@ Available commands:
 
 import argparse
 import csv
+import itertools
 import logging
+import os
+import sys
 from datetime import datetime
+from functools import lru_cache
 
 from database import DatabaseRepository
 from models import UserStatus
 
 logger = logging.getLogger(__name__)
 
+CSV_BUFFER_BYTES = 1 << 20   # export file write buffer
 
+
+@lru_cache(maxsize=1)
 def _get_db() -> DatabaseRepository:
+    # One repository (and its per-thread connection) shared by every command
     return DatabaseRepository("data/chatbot.db")
 
 
@@ -39,21 +47,28 @@ def create_admin(username: str, password: str):
         print(f"❌ Admin user '{username}' already exists!")
 
 
-def list_users():
+def list_users(page: int = 1, page_size: int = 50):
     db    = _get_db()
-    users = db.get_all_users(limit=1000)
-    print("\n" + "=" * 80)
-    print(f"Total Users: {len(users)}")
-    print("=" * 80)
+    page  = max(page, 1)
+    users = db.get_all_users_light(limit=page_size, offset=(page - 1) * page_size)
+    lines = [
+        "\n" + "=" * 80,
+        f"Users (page {page}, {len(users)} shown)",
+        "=" * 80,
+    ]
     for user in users:
-        print(f"\nID: {user.user_id}")
-        print(f"Email: {user.email}")
-        print(f"Name: {user.full_name}")
-        print(f"Status: {user.status.value}")
-        print(f"Total Queries: {user.total_queries}")
-        print(f"Created: {user.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Last Login: {user.last_login.strftime('%Y-%m-%d %H:%M:%S') if user.last_login else 'Never'}")
-        print("-" * 80)
+        lines += [
+            f"\nID: {user.user_id}",
+            f"Email: {user.email}",
+            f"Name: {user.full_name}",
+            f"Status: {user.status}",
+            f"Total Queries: {user.total_queries}",
+            f"Created: {user.created_at.isoformat(' ', 'seconds')}",
+            f"Last Login: {user.last_login.isoformat(' ', 'seconds') if user.last_login else 'Never'}",
+            "-" * 80,
+        ]
+    # One write per page instead of one per line
+    print("\n".join(lines))
 
 
 def block_user(user_id: int):
@@ -79,17 +94,20 @@ def unblock_user(user_id: int):
 def show_stats():
     db    = _get_db()
     stats = db.get_statistics()
-    print("\n" + "=" * 60)
-    print("📊 SYSTEM STATISTICS")
-    print("=" * 60)
-    print(f"\nUsers:")
-    print(f"  - Total: {stats.get('total_users', 0)}")
-    print(f"  - Active (7 days): {stats.get('active_users_7d', 0)}")
-    print(f"\nConversations:")
-    print(f"  - Total: {stats.get('total_conversations', 0)}")
-    print(f"  - Today: {stats.get('conversations_today', 0)}")
-    print(f"  - Avg Response Time: {stats.get('avg_response_time_ms', 0):.0f} ms")
-    print("=" * 60 + "\n")
+    # One write for the whole report
+    print(
+        "\n" + "=" * 60 + "\n"
+        "📊 SYSTEM STATISTICS\n"
+        + "=" * 60 + "\n"
+        "\nUsers:\n"
+        f"  - Total: {stats.get('total_users', 0)}\n"
+        f"  - Active (7 days): {stats.get('active_users_7d', 0)}\n"
+        "\nConversations:\n"
+        f"  - Total: {stats.get('total_conversations', 0)}\n"
+        f"  - Today: {stats.get('conversations_today', 0)}\n"
+        f"  - Avg Response Time: {stats.get('avg_response_time_ms', 0):.0f} ms\n"
+        + "=" * 60 + "\n"
+    )
 
 
 def export_conversations(user_email: str = None):
@@ -99,39 +117,53 @@ def export_conversations(user_email: str = None):
         if not user:
             print(f"❌ User {user_email} not found!")
             return
-        conversations = db.get_user_conversations(user.user_id, limit=10000)
+        conversations = db.iter_conversations_filtered(user_id=user.user_id)
         filename = f"conversations_{user.user_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
     else:
-        recent        = db.get_recent_conversations(limit=10000)
-        conversations = [conv for conv, _ in recent]
+        conversations = db.iter_conversations_filtered()
         filename      = f"all_conversations_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
 
-    with open(filename, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow(['ID', 'User ID', 'Message', 'Response', 'Type', 'Timestamp', 'Response Time (ms)'])
-        for conv in conversations:
-            writer.writerow([
-                conv.conversation_id, conv.user_id,
-                conv.message, conv.response,
-                conv.conversation_type,
-                conv.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-                conv.response_time_ms or 'N/A',
-            ])
-    print(f"✅ Exported {len(conversations)} conversations to {filename}")
+    # One query streamed from the cursor: no model objects, no row cap.
+    # writerows drives the generator from C; zip advances `rows_written` once per row.
+    rows_written = itertools.count()
+    try:
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_BYTES) as f:
+            writer = csv.writer(f)
+            writer.writerow(['ID', 'User ID', 'Message', 'Response', 'Type', 'Timestamp', 'Response Time (ms)'])
+            writer.writerows(
+                (conv.conversation_id, conv.user_id,
+                 conv.message, conv.response,
+                 conv.conversation_type,
+                 conv.timestamp.isoformat(' ', 'seconds'),
+                 conv.response_time_ms or 'N/A')
+                for conv, _ in zip(conversations, rows_written)
+            )
+    except Exception as e:
+        # Remove the truncated file and exit non-zero rather than report success
+        if os.path.exists(filename):
+            os.remove(filename)
+        print(f"❌ Export failed: {e}")
+        sys.exit(1)
+    print(f"✅ Exported {next(rows_written)} conversations to {filename}")
+
+
+def _found_users(db: DatabaseRepository, user_ids: list) -> dict:
+    """user_id -> User for the IDs that exist (one query), warning about the rest."""
+    found = db.get_users_by_ids(user_ids)
+    for user_id in user_ids:
+        if user_id not in found:
+            print(f"⚠️  User ID {user_id} not found!")
+    return {user_id: found[user_id] for user_id in user_ids if user_id in found}
 
 
 def delete_conversations(user_ids: list):
-    db = _get_db()
-    total = 0
-    for user_id in user_ids:
-        user = db.get_user_by_id(user_id)
-        if not user:
-            print(f"⚠️  User ID {user_id} not found!")
-            continue
-        count  = db.delete_user_conversations(user_id)
-        total += count
-        print(f"✅ Deleted {count} conversations for user {user_id} ({user.email})")
-    print(f"\n📊 Total conversations deleted: {total}")
+    db    = _get_db()
+    users = _found_users(db, user_ids)
+    # All deletions commit together
+    counts = db.delete_conversations_for_users(list(users))
+    for user_id, count in counts.items():
+        print(f"✅ Deleted {count} conversations for user {user_id} ({users[user_id].email})")
+    print(f"\n📊 Total conversations deleted: {sum(counts.values())}")
 
 
 def delete_users(user_ids: list):
@@ -141,18 +173,15 @@ def delete_users(user_ids: list):
     if confirm.lower() != 'yes':
         print("❌ Deletion cancelled.")
         return
-    total = 0
-    for user_id in user_ids:
-        user = db.get_user_by_id(user_id)
-        if not user:
-            print(f"⚠️  User ID {user_id} not found!")
-            continue
-        if db.delete_user(user_id):
-            total += 1
+    users = _found_users(db, user_ids)
+    # All deletions commit together
+    deleted = set(db.delete_users(list(users)))
+    for user_id, user in users.items():
+        if user_id in deleted:
             print(f"✅ Deleted user {user_id} ({user.email})")
         else:
             print(f"❌ Failed to delete user {user_id}")
-    print(f"\n📊 Total users deleted: {total}")
+    print(f"\n📊 Total users deleted: {len(deleted)}")
 
 
 # ── CLI parser ────────────────────────────────────────────────────────────────
@@ -164,7 +193,9 @@ def main():
     p = sub.add_parser('create-admin', help='Create admin user')
     p.add_argument('username'); p.add_argument('password')
 
-    sub.add_parser('list-users', help='List all users')
+    p = sub.add_parser('list-users', help='List users, newest first, one page at a time')
+    p.add_argument('--page',      type=int, default=1,  help='Page number (default: 1)')
+    p.add_argument('--page-size', type=int, default=50, help='Users per page (default: 50)')
 
     p = sub.add_parser('block-user',   help='Block a user')
     p.add_argument('user_id', type=int)
@@ -187,7 +218,7 @@ def main():
 
     commands = {
         'create-admin':        lambda: create_admin(args.username, args.password),
-        'list-users':          list_users,
+        'list-users':          lambda: list_users(args.page, args.page_size),
         'block-user':          lambda: block_user(args.user_id),
         'unblock-user':        lambda: unblock_user(args.user_id),
         'stats':               show_stats,
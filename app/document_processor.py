@@ -2,6 +2,9 @@
 Document processing: chunking and section extraction.
 """
 
+import mmap
+import os
+import re
 from typing import List, Dict
 from src.chunker import Chunker
 
@@ -9,30 +12,54 @@ from src.chunker import Chunker
 class DocumentProcessor:
     """Handles document processing and chunking using smart chunker."""
 
+    # A markdown header line: optional indentation, then '#'. [^\S\n] keeps the
+    # leading-whitespace match on one line.
+    HEADER_PATTERN = re.compile(r'^[^\S\n]*#.*$', re.MULTILINE)
+
     def __init__(self):
         self.chunker = Chunker()
 
+    @staticmethod
+    def read_document(path: os.PathLike) -> str:
+        """
+        Read a UTF-8 document through a read-only memory map. The text is decoded
+        straight from the mapped pages, so the file's bytes are never copied onto
+        the heap next to the decoded string. Newlines are normalised like text mode.
+        """
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, 'utf-8')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+
     @staticmethod
     def chunk_text(text: str, chunk_size: int = None, overlap: int = None) -> List[str]:
         """Split text using separator-based chunking. chunk_size/overlap are ignored (kept for compatibility)."""
         return Chunker.chunk_text(text, chunk_size, overlap)
 
-    @staticmethod
-    def extract_sections(text: str) -> List[Dict[str, str]]:
-        """Extract sections based on markdown headers."""
+    @classmethod
+    def extract_sections(cls, text: str) -> List[Dict[str, str]]:
+        """
+        Extract sections based on markdown headers.
+        Headers are found in one regex scan and each section body is a single
+        slice of `text` between two headers (no per-line concatenation).
+        """
         sections = []
-        current_section = {"title": "Introduction", "content": ""}
+        title, start = "Introduction", 0
 
-        for line in text.split('\n'):
-            if line.strip().startswith('#'):
-                if current_section["content"].strip():
-                    sections.append(current_section)
-                title = line.strip().lstrip('#').strip()
-                current_section = {"title": title, "content": ""}
-            else:
-                current_section["content"] += line + "\n"
+        for header in cls.HEADER_PATTERN.finditer(text):
+            content = text[start:header.start()]
+            if content.strip():
+                sections.append({"title": title, "content": content})
+            title = header.group().strip().lstrip('#').strip()
+            start = header.end() + 1
 
-        if current_section["content"].strip():
-            sections.append(current_section)
+        # Every body line ends with "\n", including the document's last one
+        content = text[start:] + "\n"
+        if content.strip():
+            sections.append({"title": title, "content": content})
 
-        return sections
\ No newline at end of file
+        return sections
@@ -10,6 +10,7 @@ import logging
 import shutil
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Generator, List, Optional
@@ -38,6 +39,18 @@ class MessageHandler:
         self.vlm = vlm_handler
         self.db = db
         self.auth = auth
+        # Conversations are persisted off the request path by one writer thread,
+        # which keeps inserts in order (concurrent.futures joins it at exit)
+        self._db_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+
+    def _save_conversation(self, conversation: Conversation):
+        self._db_writer.submit(self.db.save_conversation, conversation)
+
+    def flush_pending_saves(self):
+        """Block until every queued conversation is in the database (before reading it back)."""
+        # FIFO barrier: the single writer runs this no-op only after every save
+        # submitted before it, however concurrent handlers interleaved
+        self._db_writer.submit(lambda: None).result()
 
     @traceable(name="process_multimodal_message", run_type="chain")
     def process_stream(
@@ -123,7 +136,7 @@ class MessageHandler:
         session.add_message("user", message)
         session.add_message("assistant", full_response)
 
-        self.db.save_conversation(Conversation(
+        self._save_conversation(Conversation(
             user_id=user_id,
             session_id=session.session_id,
             message=message,
@@ -223,7 +236,7 @@ class MessageHandler:
         # Save attachments to uploads/
         attachments_meta = self._save_attachments(files)
 
-        self.db.save_conversation(Conversation(
+        self._save_conversation(Conversation(
             user_id=user_id,
             session_id=session.session_id,
             message=user_display_msg,
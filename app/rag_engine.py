@@ -2,9 +2,17 @@
 RAG engine: document indexing, vector retrieval, and context formatting.
 """
 
+import hashlib
+import json
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 
 from langsmith import traceable
 
@@ -16,6 +24,61 @@ from app.document_processor import DocumentProcessor
 
 logger = logging.getLogger(__name__)
 
+# Retrieval results kept for repeated questions; cleared after every re-index. Query
+# embeddings outlive that in encode_query's cache, so a cleared entry costs no API call.
+RETRIEVAL_CACHE_SIZE = 256
+
+# Fewer files than this are chunked in-process: pool start-up and pickling would cost
+# more than the chunking itself (the usual incremental sync touches one or two files)
+PARALLEL_CHUNK_MIN_FILES = 4
+
+# Lives next to the vector DB: {file name: {"sha256": content hash, "chunks": chunk count}}
+MANIFEST_FILE = "docs_manifest.json"
+
+
+def _file_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _chunk_id(file_name: str, index: int) -> str:
+    """Deterministic vector ID: a document's chunks can be replaced without touching the rest."""
+    return f"{file_name}:{index}"
+
+
+def _chunk_document(doc_file: Path) -> Tuple[Dict, int, List[Tuple[str, Dict]]]:
+    """
+    Read, validate, split into sections and chunk one document.
+    Module-level so indexing can run it in worker processes.
+    Returns (validation, section count, [(chunk, metadata), ...]).
+    """
+    content = DocumentProcessor.read_document(doc_file)
+
+    validation = Chunker.validate_document_format(content)
+    if not validation['valid']:
+        return validation, 0, []
+
+    sections = DocumentProcessor.extract_sections(content)
+    pairs: List[Tuple[str, Dict]] = []
+    for section in sections:
+        section_title = section["title"]
+        section_content = section["content"]
+
+        if not section_content.strip():
+            continue
+
+        chunks = DocumentProcessor.chunk_text(section_content)
+        if not chunks:
+            logger.error(f"❌ No chunks created for section '{section_title}' in {doc_file.name}")
+            continue
+
+        # Chunks arrive stripped and non-empty from the separator chunker
+        pairs.extend(
+            (chunk, Chunker.extract_metadata_from_chunk(chunk, doc_file.stem, section_title, i))
+            for i, chunk in enumerate(chunks)
+        )
+
+    return validation, len(sections), pairs
+
 
 class RAGEngine:
     """Handles document loading/indexing and semantic retrieval."""
@@ -25,84 +88,48 @@ class RAGEngine:
         self.vector_store = VectorStore(Config.CHROMA_DB_PATH)
         self.doc_processor = DocumentProcessor()
         self.collection = None
+        self._retrieval_cache = lru_cache(maxsize=RETRIEVAL_CACHE_SIZE)(self._retrieve)
 
     def initialize(self):
-        """Load existing vector DB or build it from documents."""
+        """Load the existing vector DB and re-index changed documents, or build it from scratch."""
         logger.info("Initializing vector database...")
-        try:
-            self.collection = self.vector_store.get_collection()
-            logger.info("✅ Loaded existing vector database")
-        except Exception:
+        if not self.vector_store.has_collection():
             logger.info("No existing database found — building from documents...")
             self.load_documents()
+        elif not self._manifest_path.exists():
+            # Indexed before manifests existed: its chunk IDs can't be traced back to files
+            logger.info("No index manifest found — rebuilding from documents...")
+            self.load_documents()
+        else:
+            self.collection = self.vector_store.get_collection()
+            logger.info("✅ Loaded existing vector database")
+            self.sync_documents()
 
     @traceable(name="load_and_index_documents")
     def load_documents(self) -> Tuple[bool, str]:
-        """Load all .md / .txt files from DOCS_FOLDER and index them."""
+        """Load all .md / .txt files from DOCS_FOLDER and index them from scratch."""
         try:
             logger.info(f"Loading documents from {Config.DOCS_FOLDER}...")
-            self.collection = self.vector_store.create_collection(reset=True)
-
-            docs_path = Path(Config.DOCS_FOLDER)
-            md_files = list(docs_path.glob("*.md")) + list(docs_path.glob("*.txt"))
-
-            if not md_files:
-                return False, f"❌ No documents found in {Config.DOCS_FOLDER}"
-
-            logger.info(f"Found {len(md_files)} document(s)")
-            total_chunks = 0
-            all_chunks: List[str] = []
-            all_metadatas: List[Dict] = []
-            skipped_docs: List[str] = []
-
-            for doc_file in md_files:
-                logger.info(f"\n{'='*60}\nProcessing: {doc_file.name}\n{'='*60}")
-
-                with open(doc_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                validation = self.doc_processor.chunker.validate_document_format(content)
-                logger.info(f"Validation: {validation['message']}")
-
-                if not validation['valid']:
-                    logger.error(f"❌ Skipping {doc_file.name}: {validation['message']}")
-                    skipped_docs.append(doc_file.name)
-                    continue
+            try:
+                self.collection = self.vector_store.create_collection(reset=True)
 
-                sections = self.doc_processor.extract_sections(content)
-                logger.info(f"Found {len(sections)} section(s)")
+                md_files = self._doc_files()
+                if not md_files:
+                    return False, f"❌ No documents found in {Config.DOCS_FOLDER}"
 
-                for section in sections:
-                    section_title = section["title"]
-                    section_content = section["content"]
+                logger.info(f"Found {len(md_files)} document(s)")
+                manifest: Dict = {}
+                total_chunks, skipped_docs = self._index_files(md_files, manifest)
+            finally:
+                # After the index changed, so nothing cached mid-rebuild survives it
+                self._retrieval_cache.cache_clear()
 
-                    if not section_content.strip():
-                        continue
-
-                    chunks = self.doc_processor.chunk_text(section_content)
-                    if not chunks:
-                        logger.error(f"❌ No chunks created for section '{section_title}'")
-                        continue
-
-                    for i, chunk in enumerate(chunks):
-                        if not chunk.strip():
-                            continue
-                        all_chunks.append(chunk)
-                        metadata = Chunker.extract_metadata_from_chunk(
-                            chunk, doc_file.stem, section_title, i
-                        )
-                        all_metadatas.append(metadata)
-                        total_chunks += 1
-
-            if not all_chunks:
+            if not total_chunks:
                 msg = f"❌ No chunks created! Processed {len(md_files)} files, skipped {len(skipped_docs)}."
                 logger.error(msg)
                 return False, msg
 
-            logger.info(f"✅ Created {total_chunks} chunks — generating embeddings...")
-            embeddings = self.embedding_manager.encode_batch(all_chunks)
-            self.vector_store.add_documents(all_chunks, all_metadatas, embeddings)
-
+            self._save_manifest(manifest)
             final_count = self.collection.count()
             msg = f"✅ Indexed {final_count} chunks from {len(md_files)} documents!"
             logger.info(msg)
@@ -113,13 +140,140 @@ class RAGEngine:
             logger.error(msg, exc_info=True)
             return False, msg
 
+    @traceable(name="sync_indexed_documents")
+    def sync_documents(self) -> Tuple[bool, str]:
+        """
+        Bring the index in line with DOCS_FOLDER using the content-hash manifest:
+        only new or edited documents are re-chunked and re-embedded, chunks of
+        edited or deleted documents are dropped, unchanged documents are skipped.
+        """
+        try:
+            manifest = self._load_manifest()
+            md_files = self._doc_files()
+            digests = {f.name: _file_sha256(f) for f in md_files}
+
+            changed = [f for f in md_files if manifest.get(f.name, {}).get("sha256") != digests[f.name]]
+            stale = [name for name in manifest if name not in digests]
+            stale += [f.name for f in changed if f.name in manifest]
+            if not changed and not stale:
+                msg = f"✅ Vector database up to date ({len(md_files)} documents unchanged)"
+                logger.info(msg)
+                return True, msg
+
+            stale_ids: List[str] = []
+            for name in stale:
+                stale_ids += [_chunk_id(name, i) for i in range(manifest.pop(name)["chunks"])]
+            try:
+                if stale_ids:
+                    self.vector_store.delete_documents(stale_ids)
+
+                total_chunks, _ = self._index_files(changed, manifest, digests) if changed else (0, [])
+            finally:
+                # After the index changed, so nothing cached mid-sync survives it
+                self._retrieval_cache.cache_clear()
+            self._save_manifest(manifest)
+
+            msg = (f"✅ Re-indexed {len(changed)} changed document(s) into {total_chunks} chunks, "
+                   f"removed {len(stale_ids)} stale chunks")
+            logger.info(msg)
+            return True, msg
+
+        except Exception as e:
+            msg = f"❌ Error syncing documents: {str(e)}"
+            logger.error(msg, exc_info=True)
+            return False, msg
+
+    @staticmethod
+    def _doc_files() -> List[Path]:
+        docs_path = Path(Config.DOCS_FOLDER)
+        return list(docs_path.glob("*.md")) + list(docs_path.glob("*.txt"))
+
+    @property
+    def _manifest_path(self) -> Path:
+        return Path(Config.CHROMA_DB_PATH) / MANIFEST_FILE
+
+    def _load_manifest(self) -> Dict:
+        return json.loads(self._manifest_path.read_text(encoding="utf-8"))
+
+    def _save_manifest(self, manifest: Dict):
+        # Written to a temp file and swapped in, so a crash never leaves half a manifest
+        tmp_path = self._manifest_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self._manifest_path)
+
+    def _index_files(self, md_files: List[Path], manifest: Dict,
+                     digests: Dict[str, str] = None) -> Tuple[int, List[str]]:
+        """
+        Chunk, embed and store `md_files`, recording each one in `manifest`.
+        Returns (chunks indexed, names of skipped documents).
+        """
+        if digests is None:
+            digests = {f.name: _file_sha256(f) for f in md_files}
+        skipped_docs: List[str] = []
+
+        # Embed and write batch by batch: memory stays bounded by the batch
+        # size rather than the whole corpus. Writes run on a single background
+        # thread, so batch k is stored while batch k+1 is being embedded.
+        chunk_stream = self._iter_chunks(md_files, skipped_docs, manifest, digests)
+        total_chunks = 0
+        pending_write = None
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="index-writer") as writer:
+            while batch := list(islice(chunk_stream, Config.INDEX_BATCH_SIZE)):
+                ids, chunks, metadatas = (list(column) for column in zip(*batch))
+                embeddings = self.embedding_manager.encode_batch(chunks)
+                if pending_write:
+                    pending_write.result()  # one write in flight; surfaces its errors
+                pending_write = writer.submit(
+                    self.vector_store.add_documents, chunks, metadatas, embeddings, ids=ids,
+                )
+                total_chunks += len(chunks)
+                logger.info(f"Embedded {total_chunks} chunks so far...")
+            if pending_write:
+                pending_write.result()
+
+        return total_chunks, skipped_docs
+
+    def _iter_chunks(self, md_files: List[Path], skipped_docs: List[str], manifest: Dict,
+                     digests: Dict[str, str]) -> Iterator[Tuple[str, str, Dict]]:
+        """
+        Yield (id, chunk, metadata) for every chunk of every valid document, in file order,
+        and record each file's hash and chunk count in `manifest`.
+        Larger batches of files are parsed and chunked in parallel worker processes.
+        """
+        with ExitStack() as stack:
+            if len(md_files) < PARALLEL_CHUNK_MIN_FILES:
+                results = map(_chunk_document, md_files)
+            else:
+                workers = min(os.cpu_count() or 1, len(md_files))
+                pool = stack.enter_context(multiprocessing.Pool(workers))
+                results = pool.imap(_chunk_document, md_files)
+            for doc_file, (validation, section_count, pairs) in zip(md_files, results):
+                logger.info(f"\n{'='*60}\nProcessing: {doc_file.name}\n{'='*60}")
+                logger.info(f"Validation: {validation['message']}")
+                manifest[doc_file.name] = {"sha256": digests[doc_file.name], "chunks": len(pairs)}
+
+                if not validation['valid']:
+                    logger.error(f"❌ Skipping {doc_file.name}: {validation['message']}")
+                    skipped_docs.append(doc_file.name)
+                    continue
+
+                logger.info(f"Found {section_count} section(s)")
+                for i, (chunk, metadata) in enumerate(pairs):
+                    yield _chunk_id(doc_file.name, i), chunk, metadata
+
     @traceable(name="retrieve_relevant_chunks", run_type="retriever")
     def retrieve(self, query: str, top_k: int = None) -> Dict:
-        """Embed query and return top-k matching chunks from the vector store."""
+        """
+        Embed query and return top-k matching chunks from the vector store.
+        Repeated queries (whitespace-normalised) are answered from a cache that
+        every re-index clears; callers must not mutate the returned dict.
+        """
         if top_k is None:
             top_k = Config.TOP_K_RESULTS
+        return self._retrieval_cache(" ".join(query.split()), top_k)
 
-        query_embedding = self.embedding_manager.encode(query)
+    def _retrieve(self, query: str, top_k: int) -> Dict:
+        query_embedding = self.embedding_manager.encode_query(query)
         results = self.vector_store.query(query_embedding, top_k)
 
         if results['documents'] and results['documents'][0]:
@@ -13,6 +13,10 @@ from app.ui_styles import CUSTOM_CSS, PASTE_FIX_JS, LAUNCH_CSS
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CONCURRENCY = 4    # concurrent light handlers (login, sidebar, session restore)
+RESPOND_CONCURRENCY = 8    # concurrent chat replies: I/O-bound on the LLM / embedding APIs
+QUEUE_MAX_SIZE      = 64   # pending events before new ones are rejected
+
 
 def get_logo_base64() -> str:
     logo_path = Path("assets/logo.png")
@@ -215,6 +219,7 @@ def build_interface(app) -> gr.Blocks:
                 return ([], gr.update(visible=True), gr.update(visible=False),
                         gr.update(visible=False), gr.update(visible=True), None)
 
+            app.msg_handler.flush_pending_saves()
             session = app.session_mgr.restore_from_db(user.user_id, session_id)
             history = session.get_chat_history()
 
@@ -234,6 +239,8 @@ def build_interface(app) -> gr.Blocks:
 
         def logout_handler(user, _session):
             if user:
+                # Sessions are rebuilt from the DB after re-login; land queued saves first
+                app.msg_handler.flush_pending_saves()
                 app.session_mgr.clear_user(user.user_id)
             return {
                 login_section:         gr.update(visible=True),
@@ -276,6 +283,7 @@ def build_interface(app) -> gr.Blocks:
             respond,
             inputs=[msg_welcome, chatbot, user_state, current_session_id],
             outputs=[chatbot, chatbot, welcome_screen, input_bottom, msg_welcome, msg_welcome],
+            concurrency_limit=RESPOND_CONCURRENCY, concurrency_id="respond",
         ).then(refresh_sidebar, inputs=[user_state], outputs=[conversation_selector])
 
         # Bottom input
@@ -283,6 +291,7 @@ def build_interface(app) -> gr.Blocks:
             respond,
             inputs=[msg, chatbot, user_state, current_session_id],
             outputs=[chatbot, chatbot, welcome_screen, input_bottom, msg_welcome, msg],
+            concurrency_limit=RESPOND_CONCURRENCY, concurrency_id="respond",
         ).then(refresh_sidebar, inputs=[user_state], outputs=[conversation_selector])
 
         # Sidebar session selection
@@ -300,4 +309,7 @@ def build_interface(app) -> gr.Blocks:
                      conversation_selector],
         )
 
+    # Replies wait on network calls, not CPU: serve several users side by side.
+    # Both chat inputs share the "respond" pool.
+    demo.queue(default_concurrency_limit=DEFAULT_CONCURRENCY, max_size=QUEUE_MAX_SIZE)
     return demo
\ No newline at end of file
@@ -30,6 +30,9 @@ class Config:
     CHUNK_SIZE = 400
     CHUNK_OVERLAP = 50
     TOP_K_RESULTS = 5
+
+    # Indexing: chunks embedded and written to the vector store per batch
+    INDEX_BATCH_SIZE = int(os.getenv("INDEX_BATCH_SIZE", "200"))
     
 
     # LangSmith Configuration
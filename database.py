@@ -3,17 +3,34 @@ Database repository - Following Repository Pattern and Interface Segregation Pri
 Separates data access logic from business logic
 """
 
+import atexit
+import json
 import sqlite3
-from typing import List, Optional, Tuple
+import threading
+import weakref
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 from pathlib import Path
-from models import User, Conversation, AdminUser, UserStatus
+from models import User, Conversation, AdminUser, UserStatus, UserRow, ConversationRow
 import hashlib
 
 
 logger = logging.getLogger(__name__)
 
+# Live repositories; weak so the exit hook never keeps one (or its connections) alive
+_repositories = weakref.WeakSet()
+
+
+@atexit.register
+def _optimize_at_exit():
+    """Run PRAGMA optimize once per database file still open at interpreter exit."""
+    optimized = set()
+    for repo in list(_repositories):
+        if repo.db_path not in optimized:
+            optimized.add(repo.db_path)
+            repo.optimize()
+
 
 class DatabaseRepository:
     """
@@ -21,16 +38,37 @@ class DatabaseRepository:
     OCP: Open for extension (new methods) but closed for modification
     """
     
+    # Prepared statements kept per connection (sqlite3 caches them by SQL text)
+    STATEMENT_CACHE_SIZE = 256
+    # Page cache per connection, in KiB (negative = size rather than page count)
+    PAGE_CACHE_KIB = 65536
+    # Memory-mapped reads per connection, in bytes (256 MiB)
+    MMAP_SIZE = 268435456
+
     def __init__(self, db_path: str = "data/chatbot.db"):
         """Initialize database connection"""
         self.db_path = db_path
+        self._local = threading.local()
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         self._initialize_database()
+        _repositories.add(self)
     
     def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """
+        Get this thread's database connection.
+        Reusing one connection per thread keeps sqlite3's prepared-statement
+        cache warm, so hot queries are parsed and planned only once.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, cached_statements=self.STATEMENT_CACHE_SIZE)
+            conn.row_factory = sqlite3.Row
+            # WAL (set once in _initialize_database) makes NORMAL sync durable enough
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA cache_size=-{self.PAGE_CACHE_KIB}")
+            conn.execute(f"PRAGMA mmap_size={self.MMAP_SIZE}")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._local.conn = conn
         return conn
     
     def _initialize_database(self):
@@ -38,6 +76,10 @@ class DatabaseRepository:
         with self._get_connection() as conn:
             cursor = conn.cursor()
             
+            # Write-ahead log: dashboard readers never block the chatbot's
+            # inserts (or each other). Persistent in the database file.
+            cursor.execute("PRAGMA journal_mode=WAL")
+            
             # Users table:
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS users (
@@ -63,6 +105,7 @@ class DatabaseRepository:
                     conversation_type TEXT DEFAULT 'TECHNICAL',
                     response_time_ms INTEGER,
                     attachments TEXT,
+                    has_image INTEGER NOT NULL DEFAULT 0,
                     FOREIGN KEY (user_id) REFERENCES users (user_id)
                 )
             ''')
@@ -78,16 +121,36 @@ class DatabaseRepository:
             ''')
             
             # Indexes for better query performance
+            # (user_id, timestamp) serves per-user history in timestamp order and,
+            # as a prefix, every plain user_id lookup the old single-column index did
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_conversations_user_id 
-                ON conversations(user_id)
+                CREATE INDEX IF NOT EXISTS idx_conversations_user_timestamp
+                ON conversations(user_id, timestamp)
             ''')
+            cursor.execute("DROP INDEX IF EXISTS idx_conversations_user_id")
             
             cursor.execute('''
                 CREATE INDEX IF NOT EXISTS idx_conversations_timestamp 
                 ON conversations(timestamp)
             ''')
 
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_conversations_type
+                ON conversations(conversation_type, timestamp)
+            ''')
+
+            # Users listings (dashboard and CLI) page by newest signup
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_users_created_at
+                ON users(created_at)
+            ''')
+
+            # "Active users (7 days)" range count in get_statistics
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_users_last_login
+                ON users(last_login)
+            ''')
+
             # ── Lightweight migrations for older databases ──────────────────
             # Must run BEFORE any index that references the new columns
             cursor.execute("PRAGMA table_info(conversations)")
@@ -101,14 +164,145 @@ class DatabaseRepository:
                 cursor.execute("ALTER TABLE conversations ADD COLUMN session_id TEXT")
                 logger.info("Migration: added 'session_id' column")
 
+            if "has_image" not in existing_cols:
+                cursor.execute("ALTER TABLE conversations ADD COLUMN has_image INTEGER NOT NULL DEFAULT 0")
+                cursor.execute("SELECT conversation_id, attachments FROM conversations WHERE attachments IS NOT NULL")
+                image_ids = [(row["conversation_id"],) for row in cursor.fetchall()
+                             if self._has_image(row["attachments"])]
+                cursor.executemany("UPDATE conversations SET has_image = 1 WHERE conversation_id = ?", image_ids)
+                logger.info(f"Migration: added 'has_image' column ({len(image_ids)} rows flagged)")
+
             # Index on session_id created AFTER migration so the column is guaranteed to exist
             cursor.execute('''
                 CREATE INDEX IF NOT EXISTS idx_conversations_session_id
                 ON conversations(session_id)
             ''')
 
+            # Partial index: only conversations with image attachments
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_conversations_images
+                ON conversations(timestamp) WHERE has_image = 1
+            ''')
+
+            self._initialize_counters(cursor)
+
             conn.commit()
+
+            # Planner statistics: a full ANALYZE the first time only; afterwards
+            # optimize() refreshes them at shutdown when row counts have drifted
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+            if cursor.fetchone() is None:
+                cursor.execute("ANALYZE")
+                conn.commit()
+
             logger.info("✅ Database initialized successfully")
+
+    def optimize(self):
+        """Run PRAGMA optimize (re-analyzes tables with stale stats). Called once per file at exit."""
+        try:
+            self._get_connection().execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.warning(f"PRAGMA optimize failed: {e}")
+
+    def _initialize_counters(self, cursor: sqlite3.Cursor):
+        """
+        Denormalized counters behind get_statistics().
+        Triggers keep them in step with every insert/delete so reading the
+        dashboard totals never needs a COUNT(*) over the full tables.
+        """
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS system_counters (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP
+            )
+        ''')
+
+        # Per-day conversation counts (rolling buckets for "today" and timeseries)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS conversation_daily_counts (
+                day TEXT PRIMARY KEY,
+                count INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+
+        # Backfill once for databases created before the counters existed
+        cursor.execute("SELECT COUNT(*) AS count FROM system_counters")
+        if cursor.fetchone()["count"] == 0:
+            cursor.execute('''
+                INSERT INTO system_counters (key, value, updated_at)
+                SELECT 'total_users', COUNT(*), CURRENT_TIMESTAMP FROM users
+                UNION ALL
+                SELECT 'total_conversations', COUNT(*), CURRENT_TIMESTAMP FROM conversations
+                UNION ALL
+                SELECT 'response_time_count', COUNT(response_time_ms), CURRENT_TIMESTAMP FROM conversations
+                UNION ALL
+                SELECT 'response_time_sum', COALESCE(SUM(response_time_ms), 0), CURRENT_TIMESTAMP FROM conversations
+            ''')
+            cursor.execute('''
+                INSERT OR REPLACE INTO conversation_daily_counts (day, count)
+                SELECT DATE(timestamp), COUNT(*) FROM conversations GROUP BY DATE(timestamp)
+            ''')
+            logger.info("Migration: initialized statistics counters")
+
+        # Bumped on any change to a table; Analytics reads them (get_data_version) to drop stale caches
+        for table in ("users", "conversations"):
+            cursor.execute('''
+                INSERT OR IGNORE INTO system_counters (key, value, updated_at)
+                VALUES (?, 0, CURRENT_TIMESTAMP)
+            ''', (f"{table}_version",))
+            for event in ("INSERT", "UPDATE", "DELETE"):
+                cursor.execute(f'''
+                    CREATE TRIGGER IF NOT EXISTS trg_{table}_version_{event.lower()} AFTER {event} ON {table}
+                    BEGIN
+                        UPDATE system_counters SET value = value + 1, updated_at = CURRENT_TIMESTAMP
+                        WHERE key = '{table}_version';
+                    END
+                ''')
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_users_count_insert AFTER INSERT ON users
+            BEGIN
+                UPDATE system_counters SET value = value + 1, updated_at = CURRENT_TIMESTAMP
+                WHERE key = 'total_users';
+            END
+        ''')
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_users_count_delete AFTER DELETE ON users
+            BEGIN
+                UPDATE system_counters SET value = value - 1, updated_at = CURRENT_TIMESTAMP
+                WHERE key = 'total_users';
+            END
+        ''')
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_conversations_count_insert AFTER INSERT ON conversations
+            BEGIN
+                UPDATE system_counters SET value = value + 1, updated_at = CURRENT_TIMESTAMP
+                WHERE key = 'total_conversations';
+                UPDATE system_counters SET value = value + 1, updated_at = CURRENT_TIMESTAMP
+                WHERE key = 'response_time_count' AND NEW.response_time_ms IS NOT NULL;
+                UPDATE system_counters SET value = value + NEW.response_time_ms, updated_at = CURRENT_TIMESTAMP
+                WHERE key = 'response_time_sum' AND NEW.response_time_ms IS NOT NULL;
+                INSERT INTO conversation_daily_counts (day, count) VALUES (DATE(NEW.timestamp), 1)
+                ON CONFLICT(day) DO UPDATE SET count = count + 1;
+            END
+        ''')
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_conversations_count_delete AFTER DELETE ON conversations
+            BEGIN
+                UPDATE system_counters SET value = value - 1, updated_at = CURRENT_TIMESTAMP
+                WHERE key = 'total_conversations';
+                UPDATE system_counters SET value = value - 1, updated_at = CURRENT_TIMESTAMP
+                WHERE key = 'response_time_count' AND OLD.response_time_ms IS NOT NULL;
+                UPDATE system_counters SET value = value - OLD.response_time_ms, updated_at = CURRENT_TIMESTAMP
+                WHERE key = 'response_time_sum' AND OLD.response_time_ms IS NOT NULL;
+                UPDATE conversation_daily_counts SET count = count - 1
+                WHERE day = DATE(OLD.timestamp);
+            END
+        ''')
     
     # ==================== USER OPERATIONS ====================
     
@@ -176,6 +370,34 @@ class DatabaseRepository:
             logger.error(f"Error getting user: {e}")
             return None
     
+    def get_users_by_ids(self, user_ids: List[int]) -> Dict[int, User]:
+        """Get several users in one query; IDs that don't exist are simply absent"""
+        ids = list(dict.fromkeys(user_ids))
+        if not ids:
+            return {}
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f'SELECT * FROM users WHERE user_id IN ({",".join("?" * len(ids))})',
+                    ids,
+                )
+                return {
+                    row['user_id']: User(
+                        user_id=row['user_id'],
+                        email=row['email'],
+                        full_name=row['full_name'],
+                        created_at=datetime.fromisoformat(row['created_at']),
+                        last_login=datetime.fromisoformat(row['last_login']) if row['last_login'] else None,
+                        status=UserStatus(row['status']),
+                        total_queries=row['total_queries']
+                    )
+                    for row in cursor.fetchall()
+                }
+        except Exception as e:
+            logger.error(f"Error getting users by IDs: {e}")
+            return {}
+    
     def update_user_login(self, user_id: int):
         """Update user's last login time"""
         try:
@@ -218,36 +440,100 @@ class DatabaseRepository:
         except Exception as e:
             logger.error(f"Error incrementing user queries: {e}")
     
-    def get_all_users(self, limit: int = 100, offset: int = 0) -> List[User]:
-        """Get all users with pagination"""
+    def get_all_users_light(self, limit: int = 100, offset: int = 0) -> List[UserRow]:
+        """Get a users page as lightweight UserRow tuples (listings only)"""
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
-                    SELECT * FROM users 
+                    SELECT user_id, email, full_name, status, total_queries,
+                           created_at, last_login
+                    FROM users 
                     ORDER BY created_at DESC 
                     LIMIT ? OFFSET ?
                 ''', (limit, offset))
-                rows = cursor.fetchall()
                 
                 return [
-                    User(
-                        user_id=row['user_id'],
-                        email=row['email'],
-                        full_name=row['full_name'],
-                        created_at=datetime.fromisoformat(row['created_at']),
-                        last_login=datetime.fromisoformat(row['last_login']) if row['last_login'] else None,
-                        status=UserStatus(row['status']),
-                        total_queries=row['total_queries']
+                    UserRow(
+                        row['user_id'],
+                        row['email'],
+                        row['full_name'],
+                        row['status'],
+                        row['total_queries'],
+                        datetime.fromisoformat(row['created_at']),
+                        datetime.fromisoformat(row['last_login']) if row['last_login'] else None,
                     )
-                    for row in rows
+                    for row in cursor.fetchall()
                 ]
         except Exception as e:
-            logger.error(f"Error getting all users: {e}")
+            logger.error(f"Error getting users: {e}")
             return []
     
+    def get_data_version(self) -> Optional[Tuple[int, int]]:
+        """(users_version, conversations_version); changes whenever either table does."""
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT key, value FROM system_counters
+                    WHERE key IN ('users_version', 'conversations_version')
+                ''')
+                versions = {row['key']: row['value'] for row in cursor.fetchall()}
+                return versions.get('users_version', 0), versions.get('conversations_version', 0)
+        except Exception as e:
+            logger.error(f"Error getting data version: {e}")
+            return None
+    
+    @staticmethod
+    def _frame_dtype_backend() -> str:
+        """dtype_backend for read_sql frames: Arrow-backed when pyarrow is installed."""
+        try:
+            import pyarrow  # noqa: F401
+            return 'pyarrow'
+        except ImportError:
+            return 'numpy_nullable'
+
+    def get_users_frame(self, limit: int = 100, offset: int = 0):
+        """
+        Users page as a pandas DataFrame read straight from the cursor,
+        skipping User object hydration. Arrow-backed when pyarrow is installed.
+        """
+        import pandas as pd
+        dtype_backend = self._frame_dtype_backend()
+
+        try:
+            with self._get_connection() as conn:
+                return pd.read_sql_query(
+                    '''
+                    SELECT user_id, email, full_name, status, total_queries,
+                           created_at, last_login
+                    FROM users
+                    ORDER BY created_at DESC
+                    LIMIT ? OFFSET ?
+                    ''',
+                    conn,
+                    params=(limit, offset),
+                    dtype_backend=dtype_backend,
+                )
+        except Exception as e:
+            logger.error(f"Error getting users frame: {e}")
+            return pd.DataFrame()
+    
     # ==================== CONVERSATION OPERATIONS ====================
     
+    @staticmethod
+    def _has_image(attachments: Optional[str]) -> int:
+        """1 if the attachments JSON lists at least one image with a path, else 0"""
+        if not attachments:
+            return 0
+        try:
+            return int(any(
+                item.get('type') == 'image' and item.get('path')
+                for item in json.loads(attachments)
+            ))
+        except (ValueError, TypeError, AttributeError):
+            return 0
+    
     def save_conversation(self, conversation: Conversation) -> Optional[int]:
         """Save a conversation to the database - returns conversation_id"""
         try:
@@ -256,8 +542,8 @@ class DatabaseRepository:
                 cursor.execute('''
                     INSERT INTO conversations 
                     (user_id, session_id, message, response, timestamp,
-                     conversation_type, response_time_ms, attachments)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                     conversation_type, response_time_ms, attachments, has_image)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ''', (
                     conversation.user_id,
                     getattr(conversation, 'session_id', None),
@@ -267,6 +553,7 @@ class DatabaseRepository:
                     conversation.conversation_type,
                     conversation.response_time_ms,
                     conversation.attachments,
+                    self._has_image(conversation.attachments),
                 ))
                 conn.commit()
                 
@@ -398,6 +685,69 @@ class DatabaseRepository:
             logger.error(f"Error getting user conversations: {e}")
             return []
     
+    def get_user_with_conversations(
+        self, user_id: int, limit: int = 100
+    ) -> Tuple[Optional[User], List[Conversation]]:
+        """
+        Fetch a user and their `limit` most recent conversations in one query
+        (user row LEFT JOINed with the conversation window).
+        Returns (None, []) if the user does not exist.
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT u.user_id, u.email, u.full_name, u.created_at, u.last_login,
+                           u.status, u.total_queries,
+                           c.conversation_id, c.session_id, c.message, c.response,
+                           c.timestamp, c.conversation_type, c.response_time_ms, c.attachments
+                    FROM users u
+                    LEFT JOIN (
+                        SELECT conversation_id, user_id, session_id, message, response,
+                               timestamp, conversation_type, response_time_ms, attachments
+                        FROM conversations
+                        WHERE user_id = ?
+                        ORDER BY timestamp DESC
+                        LIMIT ?
+                    ) c ON c.user_id = u.user_id
+                    WHERE u.user_id = ?
+                    ORDER BY c.timestamp DESC
+                ''', (user_id, limit, user_id))
+                rows = cursor.fetchall()
+                
+                if not rows:
+                    return None, []
+                
+                first = rows[0]
+                user = User(
+                    user_id=first['user_id'],
+                    email=first['email'],
+                    full_name=first['full_name'],
+                    created_at=datetime.fromisoformat(first['created_at']),
+                    last_login=datetime.fromisoformat(first['last_login']) if first['last_login'] else None,
+                    status=UserStatus(first['status']),
+                    total_queries=first['total_queries']
+                )
+                conversations = [
+                    Conversation(
+                        conversation_id=row['conversation_id'],
+                        user_id=row['user_id'],
+                        session_id=row['session_id'],
+                        message=row['message'],
+                        response=row['response'],
+                        timestamp=datetime.fromisoformat(row['timestamp']),
+                        conversation_type=row['conversation_type'],
+                        response_time_ms=row['response_time_ms'],
+                        attachments=row['attachments'],
+                    )
+                    for row in rows
+                    if row['conversation_id'] is not None
+                ]
+                return user, conversations
+        except Exception as e:
+            logger.error(f"Error getting user with conversations: {e}")
+            return None, []
+    
     def get_conversation_by_id(self, conversation_id: int) -> Optional[Conversation]:
         """Get a specific conversation by ID"""
         try:
@@ -423,45 +773,73 @@ class DatabaseRepository:
             logger.error(f"Error getting conversation by ID: {e}")
             return None
     
-    def get_recent_conversations(self, limit: int = 50) -> List[Tuple[Conversation, User]]:
-        """Get recent conversations (admin dashboard)"""
+    def get_recent_image_attachments(self, limit: int = 20) -> List[str]:
+        """Attachments JSON of the most recent conversations that carry images"""
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
-                    SELECT c.*, u.email, u.full_name 
-                    FROM conversations c
-                    JOIN users u ON c.user_id = u.user_id
-                    ORDER BY c.timestamp DESC 
+                    SELECT attachments
+                    FROM conversations
+                    WHERE has_image = 1
+                    ORDER BY timestamp DESC
                     LIMIT ?
                 ''', (limit,))
-                rows = cursor.fetchall()
-                
-                results = []
-                for row in rows:
-                    conversation = Conversation(
-                        conversation_id=row['conversation_id'],
-                        user_id=row['user_id'],
-                        session_id=row['session_id'],
-                        message=row['message'],
-                        response=row['response'],
-                        timestamp=datetime.fromisoformat(row['timestamp']),
-                        conversation_type=row['conversation_type'],
-                        response_time_ms=row['response_time_ms'],
-                        attachments=row['attachments'],
-                    )
-                    user = User(
-                        user_id=row['user_id'],
-                        email=row['email'],
-                        full_name=row['full_name'],
-                        created_at=datetime.now(),
-                        status=UserStatus.ACTIVE
-                    )
-                    results.append((conversation, user))
-                
-                return results
+                return [row['attachments'] for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"Error getting image attachments: {e}")
+            return []
+    
+    def get_recent_conversations_summary(
+        self, limit: int = 50, offset: int = 0, preview_chars: int = 100,
+        after_id: Optional[int] = None, before_id: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        Display-sized rows for the admin tables: message/response are cut to
+        `preview_chars + 1` characters and the timestamp is formatted by SQLite,
+        so full texts never leave the database. The extra character lets the
+        caller tell whether a preview was truncated.
+
+        With `after_id`, only conversations newer than that ID are returned
+        (delta refresh for the live monitor). `before_id` is the keyset cursor
+        for the Conversations tab's unfiltered pages (AdminDashboard._filtered_convs_df
+        via _recent_convs_df): only rows after that one are returned.
+
+        Returns: [{"conversation_id", "email", "message_preview", "response_preview",
+                   "conversation_type", "time", "response_time_ms"}, ...]
+        """
+        # Delta fetches walk the primary key from `after_id` upwards; IDs grow
+        # with insertion time, so an idle tick touches no rows at all.
+        if after_id is not None:
+            where, order = 'WHERE c.conversation_id > ?', 'c.conversation_id DESC'
+            params: tuple = (after_id,)
+        elif before_id is not None:
+            where = '''WHERE (c.timestamp, c.conversation_id) <
+                (SELECT timestamp, conversation_id FROM conversations WHERE conversation_id = ?)'''
+            order, params = 'c.timestamp DESC, c.conversation_id DESC', (before_id,)
+        else:
+            where, order = '', 'c.timestamp DESC, c.conversation_id DESC'
+            params = ()
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f'''
+                    SELECT c.conversation_id,
+                           u.email,
+                           SUBSTR(c.message,  1, ?) AS message_preview,
+                           SUBSTR(c.response, 1, ?) AS response_preview,
+                           c.conversation_type,
+                           STRFTIME('%Y-%m-%d %H:%M:%S', c.timestamp) AS time,
+                           c.response_time_ms
+                    FROM conversations c
+                    JOIN users u ON c.user_id = u.user_id
+                    {where}
+                    ORDER BY {order}
+                    LIMIT ? OFFSET ?
+                ''', (preview_chars + 1, preview_chars + 1, *params, limit, offset))
+                return [dict(row) for row in cursor.fetchall()]
         except Exception as e:
-            logger.error(f"Error getting recent conversations: {e}")
+            logger.error(f"Error getting recent conversations summary: {e}")
             return []
     
     # ==================== ADMIN OPERATIONS ====================
@@ -531,119 +909,227 @@ class DatabaseRepository:
             logger.error(f"Error deleting user {user_id}: {e}")
             return False
 
+    def delete_conversations_for_users(self, user_ids: List[int]) -> Dict[int, int]:
+        """
+        Delete all conversations for several users in one transaction.
+        Returns {user_id: number of deleted records}; empty on failure (nothing deleted).
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                counts: Dict[int, int] = {}
+                for user_id in user_ids:
+                    cursor.execute('DELETE FROM conversations WHERE user_id = ?', (user_id,))
+                    counts[user_id] = cursor.rowcount
+                conn.commit()
+                return counts
+        except Exception as e:
+            logger.error(f"Error deleting conversations for users {user_ids}: {e}")
+            return {}
+
+    def delete_users(self, user_ids: List[int]) -> List[int]:
+        """
+        Delete several users and all their conversations in one transaction.
+        Returns the IDs that were actually deleted; empty on failure (nothing deleted).
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                deleted: List[int] = []
+                for user_id in user_ids:
+                    cursor.execute('DELETE FROM conversations WHERE user_id = ?', (user_id,))
+                    cursor.execute('DELETE FROM users WHERE user_id = ?', (user_id,))
+                    if cursor.rowcount > 0:
+                        deleted.append(user_id)
+                conn.commit()
+                return deleted
+        except Exception as e:
+            logger.error(f"Error deleting users {user_ids}: {e}")
+            return []
+
     def get_statistics(self) -> dict:
-        """Get overall statistics aggregated over the whole dataset."""
+        """Get overall statistics from the trigger-maintained counter tables."""
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('SELECT COUNT(*) as count FROM users')
-                total_users = cursor.fetchone()['count']
-                
+                # One statement: the counter rows plus the two date-bound figures
+                # (indexed range count on last_login, today's trigger-maintained count)
                 week_ago = datetime.now() - timedelta(days=7)
-                cursor.execute('''
-                    SELECT COUNT(*) as count FROM users 
-                    WHERE last_login >= ?
-                ''', (week_ago,))
-                active_users = cursor.fetchone()['count']
-                
-                cursor.execute('SELECT COUNT(*) as count FROM conversations')
-                total_conversations = cursor.fetchone()['count']
-                
                 today = datetime.now().date()
                 cursor.execute('''
-                    SELECT COUNT(*) as count FROM conversations 
-                    WHERE DATE(timestamp) = ?
-                ''', (today,))
-                conversations_today = cursor.fetchone()['count']
+                    SELECT key, value FROM system_counters
+                    UNION ALL
+                    SELECT 'active_users_7d', COUNT(*) FROM users WHERE last_login >= ?
+                    UNION ALL
+                    SELECT 'conversations_today', COALESCE(
+                        (SELECT count FROM conversation_daily_counts WHERE day = ?), 0)
+                ''', (week_ago, today.isoformat()))
+                counters = {row['key']: row['value'] for row in cursor.fetchall()}
                 
-                cursor.execute('''
-                    SELECT AVG(response_time_ms) as avg_time 
-                    FROM conversations 
-                    WHERE response_time_ms IS NOT NULL
-                ''')
-                avg_response_time = cursor.fetchone()['avg_time'] or 0
+                rt_count = counters.get('response_time_count', 0)
+                avg_response_time = counters.get('response_time_sum', 0) / rt_count if rt_count else 0
                 
                 return {
-                    'total_users': total_users,
-                    'active_users_7d': active_users,
-                    'total_conversations': total_conversations,
-                    'conversations_today': conversations_today,
+                    'total_users': counters.get('total_users', 0),
+                    'active_users_7d': counters['active_users_7d'],
+                    'total_conversations': counters.get('total_conversations', 0),
+                    'conversations_today': counters['conversations_today'],
                     'avg_response_time_ms': round(avg_response_time, 2)
                 }
         except Exception as e:
             logger.error(f"Error getting statistics: {e}")
             return {}
 
-    def get_conversations_filtered(
+    @staticmethod
+    def _filtered_conversations_sql(
+        columns: str,
+        user_email: Optional[str],
+        date_from: Optional[datetime],
+        date_to: Optional[datetime],
+        conversation_type: Optional[str],
+        before_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+    ) -> Tuple[str, list]:
+        """
+        Build the conversations ⨝ users query for the admin filters (no ORDER/LIMIT).
+        `before_id` is a keyset cursor: only rows that sort after that conversation
+        in (timestamp DESC, conversation_id DESC) order are matched.
+        """
+        query = f'''
+            SELECT {columns}
+            FROM conversations c
+            JOIN users u ON c.user_id = u.user_id
+            WHERE 1 = 1
+        '''
+        params: list = []
+        
+        if user_id is not None:
+            query += ' AND c.user_id = ?'
+            params.append(user_id)
+        
+        if user_email:
+            query += ' AND u.email LIKE ?'
+            params.append(f"%{user_email}%")
+        
+        if date_from:
+            query += ' AND c.timestamp >= ?'
+            params.append(date_from)
+        
+        if date_to:
+            query += ' AND c.timestamp <= ?'
+            params.append(date_to)
+        
+        if conversation_type:
+            query += ' AND c.conversation_type = ?'
+            params.append(conversation_type)
+        
+        if before_id is not None:
+            query += ''' AND (c.timestamp, c.conversation_id) <
+                (SELECT timestamp, conversation_id FROM conversations WHERE conversation_id = ?)'''
+            params.append(before_id)
+        
+        return query, params
+
+    # Image paths are pulled out of the attachments JSON by SQLite's json1 functions;
+    # has_image = 1 guarantees the blob is a valid JSON array
+    _CONVERSATION_ROW_COLUMNS = '''c.conversation_id, c.user_id, u.email, c.message, c.response,
+                       c.conversation_type, c.timestamp, c.response_time_ms,
+                       CASE WHEN c.has_image = 1 THEN (
+                           SELECT GROUP_CONCAT(json_extract(value, '$.path'), ';')
+                           FROM json_each(c.attachments)
+                           WHERE CASE WHEN type = 'object'
+                                      THEN json_extract(value, '$.type') = 'image'
+                                       AND json_extract(value, '$.path') <> '' END
+                       ) END AS image_paths'''
+
+    @staticmethod
+    def _conversation_row(row: sqlite3.Row) -> ConversationRow:
+        return ConversationRow(
+            row['conversation_id'],
+            row['user_id'],
+            row['email'],
+            row['message'],
+            row['response'],
+            row['conversation_type'],
+            datetime.fromisoformat(row['timestamp']),
+            row['response_time_ms'],
+            row['image_paths'] or '',
+        )
+
+    def get_conversations_filtered_frame(
         self,
         user_email: Optional[str] = None,
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
         conversation_type: Optional[str] = None,
         limit: int = 200,
-    ) -> List[Tuple[Conversation, User]]:
-        """Get conversations with optional filters."""
+        before_id: Optional[int] = None,
+        preview_chars: int = 100,
+    ):
+        """
+        One page of filtered conversations (joined with the user's email) as a pandas
+        DataFrame read straight from the cursor, with no per-row objects. Paged by
+        keyset: pass the last conversation_id of the previous page as `before_id`,
+        so deep pages cost the same as the first one.
+
+        Only the displayed columns are selected, with the same SQL-side previews and
+        time formatting as get_recent_conversations_summary.
+        """
+        import pandas as pd
+
+        query, params = self._filtered_conversations_sql(
+            '''c.conversation_id,
+               u.email,
+               SUBSTR(c.message,  1, ?) AS message_preview,
+               SUBSTR(c.response, 1, ?) AS response_preview,
+               c.conversation_type,
+               STRFTIME('%Y-%m-%d %H:%M:%S', c.timestamp) AS time,
+               c.response_time_ms''',
+            user_email, date_from, date_to, conversation_type, before_id,
+        )
+        query += ' ORDER BY c.timestamp DESC, c.conversation_id DESC LIMIT ?'
+        params = [preview_chars + 1, preview_chars + 1, *params, limit]
+
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                
-                query = '''
-                    SELECT c.*, u.email, u.full_name 
-                    FROM conversations c
-                    JOIN users u ON c.user_id = u.user_id
-                    WHERE 1 = 1
-                '''
-                params: list = []
-                
-                if user_email:
-                    query += ' AND u.email LIKE ?'
-                    params.append(f"%{user_email}%")
-                
-                if date_from:
-                    query += ' AND c.timestamp >= ?'
-                    params.append(date_from)
-                
-                if date_to:
-                    query += ' AND c.timestamp <= ?'
-                    params.append(date_to)
-                
-                if conversation_type:
-                    query += ' AND c.conversation_type = ?'
-                    params.append(conversation_type)
-                
-                query += ' ORDER BY c.timestamp DESC LIMIT ?'
-                params.append(limit)
-                
-                cursor.execute(query, tuple(params))
-                rows = cursor.fetchall()
-                
-                results: List[Tuple[Conversation, User]] = []
-                for row in rows:
-                    conversation = Conversation(
-                        conversation_id=row['conversation_id'],
-                        user_id=row['user_id'],
-                        session_id=row['session_id'],
-                        message=row['message'],
-                        response=row['response'],
-                        timestamp=datetime.fromisoformat(row['timestamp']),
-                        conversation_type=row['conversation_type'],
-                        response_time_ms=row['response_time_ms'],
-                        attachments=row['attachments'],
-                    )
-                    user = User(
-                        user_id=row['user_id'],
-                        email=row['email'],
-                        full_name=row['full_name'],
-                        created_at=datetime.now(),
-                        status=UserStatus.ACTIVE,
-                    )
-                    results.append((conversation, user))
-                
-                return results
+                return pd.read_sql_query(
+                    query, conn, params=tuple(params),
+                    dtype_backend=self._frame_dtype_backend(),
+                )
         except Exception as e:
-            logger.error(f"Error getting filtered conversations: {e}")
-            return []
+            logger.error(f"Error getting filtered conversations frame: {e}")
+            return pd.DataFrame()
+
+    def iter_conversations_filtered(
+        self,
+        user_email: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        conversation_type: Optional[str] = None,
+        user_id: Optional[int] = None,
+        batch_size: int = 500,
+    ) -> Iterator[ConversationRow]:
+        """
+        Stream every matching conversation (newest first) as ConversationRow tuples,
+        fetching `batch_size` rows at a time so exports run in constant memory.
+        `user_id` restricts to one user exactly (the email filter is a substring match).
+        Errors propagate so a failed export is never mistaken for a complete one.
+        """
+        query, params = self._filtered_conversations_sql(
+            self._CONVERSATION_ROW_COLUMNS,
+            user_email, date_from, date_to, conversation_type, user_id=user_id,
+        )
+        query += ' ORDER BY c.timestamp DESC, c.conversation_id DESC'
+        
+        cursor = self._get_connection().cursor()
+        cursor.execute(query, tuple(params))
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield self._conversation_row(row)
 
     def get_conversations_timeseries(self, days: int = 14) -> List[Tuple[str, int]]:
         """Get conversation counts per day for the last `days` days."""
@@ -653,15 +1139,15 @@ class DatabaseRepository:
             
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+                # Pre-aggregated by the conversation triggers: reads `days` rows
                 cursor.execute(
                     '''
-                    SELECT DATE(timestamp) as day, COUNT(*) as count 
-                    FROM conversations 
-                    WHERE DATE(timestamp) BETWEEN ? AND ?
-                    GROUP BY DATE(timestamp)
-                    ORDER BY DATE(timestamp) ASC
+                    SELECT day, count 
+                    FROM conversation_daily_counts 
+                    WHERE day BETWEEN ? AND ? AND count > 0
+                    ORDER BY day ASC
                     ''',
-                    (start_date, end_date),
+                    (start_date.isoformat(), end_date.isoformat()),
                 )
                 rows = cursor.fetchall()
                 
@@ -4,7 +4,7 @@ Following Single Responsibility Principle - each model has one clear purpose
 """
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, NamedTuple
 from dataclasses import dataclass, field
 from enum import Enum
 import sqlite3
@@ -112,4 +112,28 @@ class AdminUser:
             'admin_id': self.admin_id,
             'username': self.username,
             'created_at': self.created_at.isoformat()
-        }
\ No newline at end of file
+        }
+
+
+class UserRow(NamedTuple):
+    """Read-only user row for listings - no per-instance __dict__, only displayed columns"""
+    user_id: int
+    email: str
+    full_name: str
+    status: str
+    total_queries: int
+    created_at: datetime
+    last_login: Optional[datetime]
+
+
+class ConversationRow(NamedTuple):
+    """Read-only conversation row joined with its user's email (admin tables/exports)"""
+    conversation_id: int
+    user_id: int
+    email: str
+    message: str
+    response: str
+    conversation_type: str
+    timestamp: datetime
+    response_time_ms: Optional[int]
+    image_paths: str    # ';'-joined image attachment paths, '' when none
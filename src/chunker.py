@@ -33,15 +33,15 @@ class Chunker:
             List of text chunks separated by the pattern
             Empty list if no separators found
         """
-        if not text or not text.strip():
+        if not text or text.isspace():
             logger.warning("Empty text provided to chunk_by_separator")
             return []
         
-        # Split by the separator pattern
-        chunks = Chunker.SEPARATOR_PATTERN.split(text)
-        
-        # Filter out empty chunks and strip whitespace
-        chunks = [chunk.strip() for chunk in chunks if chunk.strip()]
+        # Split by the separator pattern, then strip each piece once and drop empty ones
+        chunks = [
+            stripped for chunk in Chunker.SEPARATOR_PATTERN.split(text)
+            if (stripped := chunk.strip())
+        ]
         
         if not chunks:
             logger.warning("No chunks created after splitting by separator")
@@ -67,7 +67,7 @@ class Chunker:
             List of chunks using separator-based strategy
             Empty list if no separators found
         """
-        if not text or not text.strip():
+        if not text or text.isspace():
             logger.error("Empty or None text provided to chunk_text")
             return []
         
@@ -104,13 +104,12 @@ class Chunker:
         Returns:
             Dictionary with metadata
         """
-        # Get first line or first 50 chars as preview
-        lines = chunk.split('\n')
-        first_line = lines[0].strip() if lines else chunk[:50]
+        # First line as preview (only the first line is split off)
+        first_line = chunk.partition('\n')[0].strip()
         
         # Extract some keywords from the chunk (first 20 words)
         words = chunk.split()
-        keywords = ' '.join(words[:20]) if len(words) >= 20 else ' '.join(words)
+        keywords = ' '.join(words[:20])
         
         return {
             "document": document_name,
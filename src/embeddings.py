@@ -1,4 +1,6 @@
 from openai import OpenAI
+from array import array
+from functools import lru_cache
 from typing import List
 import logging
 import os
@@ -7,6 +9,9 @@ from langsmith import traceable
 
 logger = logging.getLogger(__name__)
 
+# Query embeddings kept for repeated questions ("hi", the UI's example prompts)
+QUERY_CACHE_SIZE = 256
+
 class EmbeddingManager:
     """Handles text embeddings using OpenAI embeddings API"""
     
@@ -16,6 +21,7 @@ class EmbeddingManager:
             logger.info(f"Loading embedding model: {model_name}")
             self.model_name = model_name
             self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+            self._query_cache = lru_cache(maxsize=QUERY_CACHE_SIZE)(self._encode_packed)
             logger.info("✅ OpenAI embedding model initialized with LangSmith tracing")
         except Exception as e:
             logger.error(f"Failed to initialize embedding model: {e}")
@@ -32,6 +38,14 @@ class EmbeddingManager:
         except Exception as e:
             logger.error(f"Failed to encode text: {e}")
             raise
+
+    def encode_query(self, text: str) -> List[float]:
+        """Encode a search query, reusing the embedding of an identical earlier query"""
+        return self._query_cache(" ".join(text.split())).tolist()
+
+    def _encode_packed(self, text: str) -> array:
+        # Packed doubles: 8 bytes per dimension instead of one float object each
+        return array('d', self.encode(text))
     @traceable(name="encode_batch_texts")
     def encode_batch(self, texts: List[str]) -> List[List[float]]:
         """Encode multiple texts to embeddings"""
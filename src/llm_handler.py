@@ -1,11 +1,32 @@
 from openai import OpenAI
+from functools import lru_cache
 from typing import List, Dict, Generator, Optional
 import logging
+import re
 import requests
 from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
+# Classifications kept per distinct message (each turn classifies its message twice:
+# once in the handler, once again in generate_response_stream)
+CLASSIFICATION_CACHE_SIZE = 1024
+
+# Messages that classify themselves without an LLM round-trip.
+# Casual: the whole message is a greeting / thanks / goodbye (nothing else asked).
+CASUAL_MESSAGE = re.compile(
+    r"(?:hi|hello|hey|hiya|yo|thanks|thank you|thank you very much|thx|ty|cheers|ok|okay|"
+    r"bye|goodbye|see you|good (?:morning|afternoon|evening)|how are you)"
+    r"(?: there| all| again| so much)?[\s!.?,:)]*",
+    re.IGNORECASE,
+)
+# Actionable: mentions Dnext (a rule of the classification prompt) or a clearly technical term.
+ACTIONABLE_KEYWORDS = re.compile(
+    r"\b(?:dnext|api|endpoint|dataset|datasets|error|code|forecast|forecasts|"
+    r"subscription|account|login|password|download|export)\b",
+    re.IGNORECASE,
+)
+
 class LLMHandler:
     """Handles OpenAI LLM interactions with conversation classification and streaming"""
     
@@ -14,6 +35,7 @@ class LLMHandler:
         try:
             self.client = OpenAI(api_key=api_key)
             self.model = model
+            self._classify_cached = lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)(self._classify)
             logger.info("✅ OpenAI client initialized")
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI client: {e}")
@@ -26,8 +48,30 @@ class LLMHandler:
         """
         Classify user message into exactly one category:
         CASUAL | ACTIONABLE
+        Obvious messages are decided locally; the rest go to the LLM, with results
+        cached per message (whitespace-normalised). Failures are not cached.
         """
+        query = " ".join(query.split())
+        fast = self._fast_classify(query)
+        if fast:
+            return fast
+        try:
+            return self._classify_cached(query)
+        except Exception as e:
+            logger.error(f"Classification error: {e}")
+            return "ACTIONABLE"  # Safe default
 
+    @staticmethod
+    def _fast_classify(query: str) -> Optional[str]:
+        """CASUAL / ACTIONABLE for unambiguous messages, None when the LLM should decide."""
+        if CASUAL_MESSAGE.fullmatch(query):
+            return "CASUAL"
+        if ACTIONABLE_KEYWORDS.search(query):
+            return "ACTIONABLE"
+        return None
+
+    def _classify(self, query: str) -> str:
+        """One classification request to the LLM; raises on API errors."""
         classification_prompt = f"""
 DNEXT Intelligence SA is a dynamic and privately-owned Swiss-based company specializing in agriculture commodity expertise.
 Classify the following user message into exactly ONE category.
@@ -53,22 +97,17 @@ Respond with ONLY ONE WORD:
 CASUAL or ACTIONABLE
 """
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": classification_prompt}],
-                temperature=0.1,
-                max_tokens=10
-            )
-
-            classification = response.choices[0].message.content.strip().upper()
-            logger.info(f"Conversation classified as: {classification}")
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": classification_prompt}],
+            temperature=0.1,
+            max_tokens=10
+        )
 
-            return classification if classification in ["CASUAL", "ACTIONABLE"] else "ACTIONABLE"
+        classification = response.choices[0].message.content.strip().upper()
+        logger.info(f"Conversation classified as: {classification}")
 
-        except Exception as e:
-            logger.error(f"Classification error: {e}")
-            return "ACTIONABLE"  # Safe default
+        return classification if classification in ["CASUAL", "ACTIONABLE"] else "ACTIONABLE"
 
     # =========================
     # HISTORY HELPER  ← NEW
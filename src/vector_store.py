@@ -68,6 +68,11 @@ class VectorStore:
             logger.error(f"Failed to reset database: {e}")
             raise
     
+    def has_collection(self, name: str = "support_docs") -> bool:
+        """Check whether a collection exists without creating or loading it"""
+        # chromadb >= 0.6 lists names; older versions list Collection objects
+        return name in {getattr(c, "name", c) for c in self.client.list_collections()}
+    
     def get_collection(self, name: str = "support_docs"):
         """Get existing collection or create if not found"""
         try:
@@ -81,7 +86,8 @@ class VectorStore:
     
     @traceable(name="add_documents_to_vectorstore")
     def add_documents(self, chunks: List[str], metadatas: List[Dict], 
-                     embeddings: List[List[float]], collection_name: str = None):
+                     embeddings: List[List[float]], collection_name: str = None,
+                     ids: List[str] = None):
         """
         Add documents to collection
         
@@ -90,6 +96,7 @@ class VectorStore:
             metadatas: List of metadata dicts for each chunk
             embeddings: List of embedding vectors
             collection_name: Optional collection name to use (if different from current)
+            ids: Optional vector IDs (default chunk_0..chunk_n); existing IDs are overwritten
         """
         # If collection_name is provided, switch to that collection
         if collection_name:
@@ -98,9 +105,10 @@ class VectorStore:
         if not self.collection:
             raise ValueError("Collection not initialized")
         
-        ids = [f"chunk_{i}" for i in range(len(chunks))]
+        if ids is None:
+            ids = [f"chunk_{i}" for i in range(len(chunks))]
         
-        self.collection.add(
+        self.collection.upsert(
             ids=ids,
             embeddings=embeddings,
             documents=chunks,
@@ -109,6 +117,14 @@ class VectorStore:
         
         logger.info(f"Added {len(chunks)} documents to vector store")
     
+    def delete_documents(self, ids: List[str]):
+        """Remove documents from the current collection by ID (unknown IDs are ignored)"""
+        if not self.collection:
+            raise ValueError("Collection not initialized")
+        
+        self.collection.delete(ids=ids)
+        logger.info(f"Deleted {len(ids)} documents from vector store")
+    
     @traceable(
         name="query_vectorstore",
         run_type="retriever",